@@ -6,7 +6,7 @@ CREATE EXTERNAL TABLE IF NOT EXISTS transcriptions.metadata (
         finished_at: timestamp
     >
 )
-PARTITIONED BY (service String, project String, speaker String, performance_date String, part int, speaker_type String, timeframe int, section int)
+PARTITIONED BY (service String, project String, speaker String, performance_date String, part int, speaker_type String, timeframe String, section int)
 ROW FORMAT SERDE 'org.openx.data.jsonserde.JsonSerDe'
 WITH SERDEPROPERTIES (
   'serialization.format' = '1',
@@ -10,7 +10,7 @@ PARTITIONED BY (
   part int,
   service string, 
   protagonist string,
-  timeframe int,
+  timeframe string,
   section int)
 ROW FORMAT SERDE 
   'org.apache.hadoop.hive.serde2.OpenCSVSerde'
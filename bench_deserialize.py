@@ -0,0 +1,79 @@
+"""
+Times the deserialization of large listing pages of the Speech to Text API (swagger_client).
+
+No service is needed: the pages are generated and handed to ApiClient.deserialize as if they had been received.
+
+    python bench_deserialize.py --items 2000 --repeat 20
+"""
+import argparse
+import json
+import time
+
+from swagger_client.api_client import ApiClient
+
+BASE_URL = 'https://westus.api.cognitive.microsoft.com/speechtotext/v3.0'
+
+
+class Response:
+    def __init__(self, data):
+        self.data = data
+
+
+def transcriptions_page(items):
+    return {
+        'values': [{
+            'self': f'{BASE_URL}/transcriptions/{i}',
+            'model': {'self': f'{BASE_URL}/models/base/{i}'},
+            'links': {'files': f'{BASE_URL}/transcriptions/{i}/files'},
+            'properties': {'diarizationEnabled': False, 'wordLevelTimestampsEnabled': True, 'duration': 'PT1H'},
+            'displayName': f'transcription {i}',
+            'locale': 'en-US',
+            'createdDateTime': '2021-01-01T00:00:00Z',
+            'lastActionDateTime': '2021-01-01T00:10:00Z',
+            'status': 'Succeeded'
+        } for i in range(items)],
+        '@nextLink': f'{BASE_URL}/transcriptions?skip={items}&top={items}'
+    }
+
+
+def files_page(items):
+    return {
+        'values': [{
+            'kind': 'Transcription',
+            'links': {'contentUrl': f'https://storage.blob.core.windows.net/files/{i}.json'},
+            'createdDateTime': '2021-01-01T00:00:00Z',
+            'properties': {'size': 1024 * i},
+            'name': f'contenturl_{i}.json',
+            'self': f'{BASE_URL}/transcriptions/1/files/{i}'
+        } for i in range(items)],
+        '@nextLink': f'{BASE_URL}/transcriptions/1/files?skip={items}&top={items}'
+    }
+
+
+def bench(api_client, response_type, response, repeat):
+    """Returns the best time of `repeat` deserializations of `response`, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        api_client.deserialize(response, response_type)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the deserialization of large listing pages.')
+    parser.add_argument('--items', type=int, default=2000, help='items per page')
+    parser.add_argument('--repeat', type=int, default=20, help='deserializations of each page')
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    for response_type, page in (('PaginatedTranscriptions', transcriptions_page(args.items)),
+                                ('PaginatedFiles', files_page(args.items))):
+        best = bench(api_client, response_type, Response(json.dumps(page)), args.repeat)
+        print(f"{response_type}: {args.items} items in {best * 1000:.1f} ms "
+              f"({best * 1e6 / args.items:.1f} us per item)")
+
+
+if __name__ == '__main__':
+    main()
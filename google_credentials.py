@@ -0,0 +1,20 @@
+from google.oauth2 import service_account
+import threading
+
+_credentials = dict()
+_lock = threading.Lock()
+
+
+def get_credentials(service_config, scopes=None):
+    """
+    Returns the service account credentials described by `service_config` (the dict of the JSON key file).
+    Credentials are built in memory and cached per (account, scopes), so every client of the process shares the
+    same access token, which google-auth refreshes transparently when it expires.
+    """
+    if scopes is not None:
+        scopes = tuple(scopes)
+    key = (service_config['client_email'], scopes)
+    with _lock:
+        if key not in _credentials:
+            _credentials[key] = service_account.Credentials.from_service_account_info(service_config, scopes=scopes)
+        return _credentials[key]
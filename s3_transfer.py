@@ -0,0 +1,116 @@
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+import boto3
+import bz2
+import io
+import threading
+
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+MAX_CONCURRENCY = 10
+# a streamed upload keeps up to `max_concurrency` parts in memory, so it uses fewer threads than a file upload
+STREAM_MAX_CONCURRENCY = 2
+
+_session = None
+_resources = dict()
+_lock = threading.Lock()
+
+
+def get_session():
+    # boto3 sessions are expensive to create and not thread-safe to create concurrently, so there is one per process
+    global _session
+    with _lock:
+        if _session is None:
+            _session = boto3.session.Session()
+        return _session
+
+
+def get_s3_resource(region=None, accelerate=False, max_concurrency=MAX_CONCURRENCY):
+    # the connection pool must be at least as large as the number of transfer threads, or they wait for each other
+    max_pool_connections = max(max_concurrency, 10) * 2
+    key = (region, accelerate, max_pool_connections)
+    session = get_session()
+    with _lock:
+        if key not in _resources:
+            _resources[key] = session.resource(
+                's3', region_name=region,
+                config=Config(s3={'use_accelerate_endpoint': accelerate},
+                              max_pool_connections=max_pool_connections))
+        return _resources[key]
+
+
+def get_transfer_config(service_config):
+    return TransferConfig(
+        multipart_threshold=int(service_config.get('multipart_threshold', MULTIPART_THRESHOLD)),
+        multipart_chunksize=int(service_config.get('multipart_chunksize', MULTIPART_CHUNK_SIZE)),
+        max_concurrency=int(service_config.get('max_concurrency', MAX_CONCURRENCY)),
+        use_threads=True)
+
+
+def create_bucket(bucket_name, region, service_config):
+    """
+    Creates a staging bucket. If `transfer_acceleration` is enabled in `service_config`, S3 Transfer Acceleration
+    is turned on for it, so that uploads go through the closest edge location.
+    """
+    s3_resource = get_s3_resource(region=region)
+    bucket = s3_resource.create_bucket(Bucket=bucket_name,
+                                       CreateBucketConfiguration={'LocationConstraint': region})
+    bucket.wait_until_exists()
+    if service_config.get('transfer_acceleration', False):
+        s3_resource.meta.client.put_bucket_accelerate_configuration(
+            Bucket=bucket_name, AccelerateConfiguration={'Status': 'Enabled'})
+    return bucket
+
+
+def upload_file(filepath, bucket_name, key, region, service_config):
+    """
+    Uploads a file with multipart uploads of `multipart_chunksize` bytes sent by `max_concurrency` threads.
+    """
+    config = get_transfer_config(service_config)
+    s3_resource = get_s3_resource(region=region, accelerate=service_config.get('transfer_acceleration', False),
+                                  max_concurrency=config.max_concurrency)
+    s3_resource.Bucket(bucket_name).upload_file(filepath, key, Config=config)
+
+
+class CompressedStream(io.RawIOBase):
+    """
+    Read-only file object with the bz2 compression of the chunks of bytes yielded by `chunks`. Chunks are pulled
+    and compressed as the stream is read, so the data is never held in memory as a whole.
+    """
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.compressor = bz2.BZ2Compressor()
+        self.buffer = bytearray()
+        self.finished = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        # reads are only short at the end of the stream: a short part would end a multipart upload
+        while len(self.buffer) < len(b) and not self.finished:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.buffer += self.compressor.flush()
+                self.finished = True
+            else:
+                self.buffer += self.compressor.compress(chunk)
+        size = min(len(b), len(self.buffer))
+        b[:size] = self.buffer[:size]
+        del self.buffer[:size]
+        return size
+
+
+def upload_stream(chunks, bucket_name, key, region=None, service_config=None):
+    """
+    Compresses the chunks of bytes yielded by `chunks` with bz2 while they are uploaded to `key`, with multipart
+    uploads of `multipart_chunksize` bytes. At most `stream_max_concurrency` parts are buffered at a time.
+    """
+    service_config = service_config or dict()
+    config = TransferConfig(
+        multipart_threshold=int(service_config.get('multipart_threshold', MULTIPART_THRESHOLD)),
+        multipart_chunksize=int(service_config.get('multipart_chunksize', MULTIPART_CHUNK_SIZE)),
+        max_concurrency=int(service_config.get('stream_max_concurrency', STREAM_MAX_CONCURRENCY)),
+        use_threads=True)
+    s3_resource = get_s3_resource(region=region, max_concurrency=config.max_concurrency)
+    s3_resource.Bucket(bucket_name).upload_fileobj(CompressedStream(chunks), key, Config=config)
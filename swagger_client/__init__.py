@@ -21,6 +21,7 @@ from swagger_client.api.default_api import DefaultApi
 # import ApiClient
 from swagger_client.api_client import ApiClient
 from swagger_client.configuration import Configuration
+from swagger_client.pagination import Paginator
 # import models into sdk package
 from swagger_client.models.api_speechtotext_v30_datasets_locales_get200_application_json_response import ApiSpeechtotextV30DatasetsLocalesGet200ApplicationJsonResponse
 from swagger_client.models.api_speechtotext_v30_endpoints_locales_get200_application_json_response import ApiSpeechtotextV30EndpointsLocalesGet200ApplicationJsonResponse
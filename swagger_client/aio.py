@@ -0,0 +1,258 @@
+# coding: utf-8
+
+"""
+    Speech to Text API v3.0
+
+    asyncio transport for the Speech to Text API v3.0 client. Not generated.
+
+    AsyncApiClient sends the requests of the generated DefaultApi with
+    aiohttp, so every DefaultApi method returns a coroutine instead of a
+    result, with the same arguments and the same models:
+
+    >>> async with AsyncApiClient(configuration) as api_client:
+    ...     api = DefaultApi(api_client)
+    ...     transcription = await api.get_transcription(transcription_id)
+
+    All the requests of a client share one aiohttp session (and its
+    connections), so one event loop can drive many concurrent transcriptions.
+"""
+
+from __future__ import absolute_import
+
+import io
+import json
+import logging
+import ssl
+
+import certifi
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError('swagger_client.aio requires aiohttp '
+                      '(pip install aiohttp).')
+
+from swagger_client.api_client import ApiClient
+from swagger_client.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+    """REST client on an aiohttp session, with the interface of
+    rest.RESTClientObject (the methods are coroutines).
+
+    The session is created on first use, in the running event loop.
+    """
+
+    def __init__(self, configuration, maxsize=None):
+        self.configuration = configuration
+
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        # maxsize is the number of requests that are allowed in parallel
+        self.maxsize = maxsize
+        self.session = None
+
+    def get_ssl_context(self):
+        configuration = self.configuration
+        if not configuration.verify_ssl:
+            return False
+        ssl_context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert or certifi.where())
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(configuration.cert_file,
+                                        keyfile=configuration.key_file)
+        if configuration.assert_hostname is False:
+            ssl_context.check_hostname = False
+        return ssl_context
+
+    def get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.maxsize,
+                                             ssl=self.get_ssl_context())
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Perform requests.
+
+        The parameters are those of rest.RESTClientObject.request. If
+        `_preload_content` is False, the aiohttp.ClientResponse is returned
+        unread; the caller must release it.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or []
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0],
+                    sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        args = {
+            'headers': headers,
+            'params': [(k, str(v)) for k, v in query_params or []],
+            'proxy': self.configuration.proxy,
+        }
+        if timeout is not None:
+            args['timeout'] = timeout
+
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if 'json' in headers['Content-Type'].lower():
+                request_body = '{}'
+                if body is not None:
+                    request_body = json.dumps(body)
+                args['data'] = request_body
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                args['data'] = post_params
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # the Content-Type with the boundary is set by aiohttp
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for k, v in post_params:
+                    if isinstance(v, tuple):
+                        filename, filedata, mimetype = v
+                        data.add_field(k, filedata, filename=filename,
+                                       content_type=mimetype)
+                    else:
+                        data.add_field(k, str(v))
+                args['data'] = data
+            elif isinstance(body, str):
+                args['data'] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            r = await self.get_session().request(method, url, **args)
+        except aiohttp.ClientSSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        if _preload_content:
+            async with r:
+                data = await r.text(encoding='utf8')
+            r = AsyncRESTResponse(r, data)
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            if not _preload_content:
+                r = AsyncRESTResponse(r, await r.text(encoding='utf8'))
+            raise ApiException(http_resp=r)
+
+        return r
+
+
+class AsyncApiClient(ApiClient):
+    """ApiClient whose requests are coroutines sent with aiohttp.
+
+    Requests are serialized and responses deserialized exactly as in
+    ApiClient, with the same models. `async_req` is ignored: every call
+    returns a coroutine. Close the client (or use it as an async context
+    manager) to release its connections.
+    """
+
+    def __init__(self, configuration=None, header_name=None, header_value=None,
+                 cookie=None):
+        super(AsyncApiClient, self).__init__(configuration, header_name,
+                                             header_value, cookie)
+        self.rest_client = AsyncRESTClientObject(self.configuration)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None,
+                 _preload_content=True, _request_timeout=None,
+                 _raw_response=None):
+        """Makes the HTTP request and returns a coroutine of the deserialized
+        data. See ApiClient.call_api for the parameters.
+        """
+        url, query_params, header_params, post_params, body = \
+            self.prepare_request(resource_path, path_params, query_params,
+                                 header_params, body, post_params, files,
+                                 auth_settings, collection_formats)
+        return self.__send(method, url, query_params, header_params,
+                           post_params, body, response_type,
+                           _return_http_data_only, _preload_content,
+                           _request_timeout, _raw_response)
+
+    async def __send(self, method, url, query_params, header_params,
+                     post_params, body, response_type, _return_http_data_only,
+                     _preload_content, _request_timeout, _raw_response):
+        response_data = await self.rest_client.request(
+            method, url, query_params=query_params, headers=header_params,
+            post_params=post_params, body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout)
+        return self.handle_response(response_data, response_type,
+                                    _return_http_data_only, _preload_content,
+                                    _raw_response)
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True,
+                _request_timeout=None):
+        """Makes the HTTP request with the aiohttp client (a coroutine)."""
+        return self.rest_client.request(
+            method, url, query_params=query_params, headers=headers,
+            post_params=post_params, body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout)
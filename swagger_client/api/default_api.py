@@ -78,6 +78,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -134,6 +135,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_dataset(self, **kwargs):  # noqa: E501
@@ -179,6 +181,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -229,6 +232,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_endpoint(self, **kwargs):  # noqa: E501
@@ -274,6 +278,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -324,6 +329,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_evaluation(self, **kwargs):  # noqa: E501
@@ -369,6 +375,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -419,6 +426,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_hook(self, **kwargs):  # noqa: E501
@@ -464,6 +472,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -514,6 +523,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_model(self, **kwargs):  # noqa: E501
@@ -559,6 +569,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -609,6 +620,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_project(self, **kwargs):  # noqa: E501
@@ -654,6 +666,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -704,6 +717,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def create_transcription(self, **kwargs):  # noqa: E501
@@ -749,6 +763,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -799,6 +814,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_base_model_log(self, locale, log_id, **kwargs):  # noqa: E501
@@ -846,6 +862,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -902,6 +919,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_base_model_logs(self, locale, **kwargs):  # noqa: E501
@@ -949,6 +967,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1001,6 +1020,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_dataset(self, id, **kwargs):  # noqa: E501
@@ -1046,6 +1066,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1096,6 +1117,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_endpoint(self, id, **kwargs):  # noqa: E501
@@ -1141,6 +1163,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1191,6 +1214,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_endpoint_log(self, id, log_id, **kwargs):  # noqa: E501
@@ -1238,6 +1262,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1294,6 +1319,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_endpoint_logs(self, id, **kwargs):  # noqa: E501
@@ -1341,6 +1367,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1393,6 +1420,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_evaluation(self, id, **kwargs):  # noqa: E501
@@ -1438,6 +1466,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1488,6 +1517,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_hook(self, id, **kwargs):  # noqa: E501
@@ -1533,6 +1563,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1583,6 +1614,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_model(self, id, **kwargs):  # noqa: E501
@@ -1628,6 +1660,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1678,6 +1711,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_project(self, id, **kwargs):  # noqa: E501
@@ -1723,6 +1757,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1773,6 +1808,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def delete_transcription(self, id, **kwargs):  # noqa: E501
@@ -1818,6 +1854,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1868,6 +1905,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_base_model(self, id, **kwargs):  # noqa: E501
@@ -1913,6 +1951,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -1963,6 +2002,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_base_model_log(self, locale, log_id, **kwargs):  # noqa: E501
@@ -2012,6 +2052,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2070,6 +2111,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_base_model_logs(self, locale, **kwargs):  # noqa: E501
@@ -2121,6 +2163,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2177,6 +2220,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_base_model_manifest(self, id, **kwargs):  # noqa: E501
@@ -2224,6 +2268,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2276,6 +2321,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_base_models(self, **kwargs):  # noqa: E501
@@ -2323,6 +2369,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2371,6 +2418,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_dataset(self, id, **kwargs):  # noqa: E501
@@ -2416,6 +2464,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2466,6 +2515,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_dataset_file(self, id, file_id, **kwargs):  # noqa: E501
@@ -2515,6 +2565,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2573,6 +2624,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_dataset_files(self, id, **kwargs):  # noqa: E501
@@ -2624,6 +2676,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2680,6 +2733,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_datasets(self, **kwargs):  # noqa: E501
@@ -2727,6 +2781,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2775,6 +2830,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_datasets_for_project(self, id, **kwargs):  # noqa: E501
@@ -2824,6 +2880,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2878,6 +2935,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_endpoint(self, id, **kwargs):  # noqa: E501
@@ -2923,6 +2981,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -2973,6 +3032,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_endpoint_log(self, id, log_id, **kwargs):  # noqa: E501
@@ -3022,6 +3082,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3080,6 +3141,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_endpoint_logs(self, id, **kwargs):  # noqa: E501
@@ -3131,6 +3193,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3187,6 +3250,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_endpoints(self, **kwargs):  # noqa: E501
@@ -3234,6 +3298,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3282,6 +3347,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_endpoints_for_project(self, id, **kwargs):  # noqa: E501
@@ -3331,6 +3397,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3385,6 +3452,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_evaluation(self, id, **kwargs):  # noqa: E501
@@ -3430,6 +3498,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3480,6 +3549,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_evaluation_file(self, id, file_id, **kwargs):  # noqa: E501
@@ -3529,6 +3599,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3587,6 +3658,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_evaluation_files(self, id, **kwargs):  # noqa: E501
@@ -3638,6 +3710,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3694,6 +3767,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_evaluations(self, **kwargs):  # noqa: E501
@@ -3741,6 +3815,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3789,6 +3864,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_evaluations_for_project(self, id, **kwargs):  # noqa: E501
@@ -3838,6 +3914,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3892,6 +3969,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_health_status(self, **kwargs):  # noqa: E501
@@ -3935,6 +4013,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -3979,6 +4058,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_hook(self, id, **kwargs):  # noqa: E501
@@ -4024,6 +4104,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4074,6 +4155,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_hooks(self, **kwargs):  # noqa: E501
@@ -4121,6 +4203,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4169,6 +4252,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_model(self, id, **kwargs):  # noqa: E501
@@ -4214,6 +4298,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4264,6 +4349,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_model_manifest(self, id, **kwargs):  # noqa: E501
@@ -4311,6 +4397,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4363,6 +4450,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_models(self, **kwargs):  # noqa: E501
@@ -4410,6 +4498,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4458,6 +4547,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_models_for_project(self, id, **kwargs):  # noqa: E501
@@ -4507,6 +4597,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4561,6 +4652,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_project(self, id, **kwargs):  # noqa: E501
@@ -4606,6 +4698,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4656,6 +4749,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_projects(self, **kwargs):  # noqa: E501
@@ -4703,6 +4797,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4751,6 +4846,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_supported_locales_for_datasets(self, **kwargs):  # noqa: E501
@@ -4794,6 +4890,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4838,6 +4935,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_supported_locales_for_endpoints(self, **kwargs):  # noqa: E501
@@ -4881,6 +4979,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -4925,6 +5024,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_supported_locales_for_evaluations(self, **kwargs):  # noqa: E501
@@ -4968,6 +5068,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5012,6 +5113,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_supported_locales_for_models(self, **kwargs):  # noqa: E501
@@ -5055,6 +5157,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5099,6 +5202,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_supported_locales_for_transcriptions(self, **kwargs):  # noqa: E501
@@ -5142,6 +5246,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5186,6 +5291,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_supported_project_locales(self, **kwargs):  # noqa: E501
@@ -5229,6 +5335,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5273,6 +5380,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_transcription(self, id, **kwargs):  # noqa: E501
@@ -5318,6 +5426,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5368,6 +5477,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_transcription_file(self, id, file_id, **kwargs):  # noqa: E501
@@ -5417,6 +5527,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5475,6 +5586,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_transcription_files(self, id, **kwargs):  # noqa: E501
@@ -5526,6 +5638,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5582,6 +5695,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_transcriptions(self, **kwargs):  # noqa: E501
@@ -5629,6 +5743,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5677,6 +5792,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def get_transcriptions_for_project(self, id, **kwargs):  # noqa: E501
@@ -5726,6 +5842,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5780,6 +5897,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def ping_hook(self, id, **kwargs):  # noqa: E501
@@ -5825,6 +5943,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5875,6 +5994,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def test_hook(self, id, **kwargs):  # noqa: E501
@@ -5920,6 +6040,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -5970,6 +6091,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_dataset(self, id, **kwargs):  # noqa: E501
@@ -6017,6 +6139,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6073,6 +6196,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_endpoint(self, id, **kwargs):  # noqa: E501
@@ -6120,6 +6244,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6176,6 +6301,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_evaluation(self, id, **kwargs):  # noqa: E501
@@ -6223,6 +6349,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6279,6 +6406,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_hook(self, id, **kwargs):  # noqa: E501
@@ -6326,6 +6454,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6382,6 +6511,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_model(self, id, **kwargs):  # noqa: E501
@@ -6429,6 +6559,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6485,6 +6616,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_project(self, id, **kwargs):  # noqa: E501
@@ -6532,6 +6664,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6588,6 +6721,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def update_transcription(self, id, **kwargs):  # noqa: E501
@@ -6635,6 +6769,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6691,6 +6826,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
 
     def upload_dataset_from_form(self, **kwargs):  # noqa: E501
@@ -6750,6 +6886,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_raw_response')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -6814,4 +6951,5 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _raw_response=params.get('_raw_response'),
             collection_formats=collection_formats)
@@ -18,6 +18,7 @@ from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
+import threading
 
 # python 2 and python 3 compatibility library
 import six
@@ -59,6 +60,13 @@ class ApiClient(object):
         'datetime': datetime.datetime,
         'object': object,
     }
+    # Compiled deserializers by type string or class, see `deserializer_for`
+    _deserializers = {}
+    _deserializers_lock = threading.RLock()
+    # Deserializers being compiled, published once all of them are complete
+    _compiling = {}
+    # Configuration of the models built by the compiled deserializers
+    _model_configuration = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None):
@@ -105,8 +113,34 @@ class ApiClient(object):
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
+            _preload_content=True, _request_timeout=None,
+            _raw_response=None):
 
+        url, query_params, header_params, post_params, body = \
+            self.prepare_request(resource_path, path_params, query_params,
+                                 header_params, body, post_params, files,
+                                 auth_settings, collection_formats)
+
+        # perform request and return response
+        response_data = self.request(
+            method, url, query_params=query_params, headers=header_params,
+            post_params=post_params, body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout)
+
+        return self.handle_response(response_data, response_type,
+                                    _return_http_data_only, _preload_content,
+                                    _raw_response)
+
+    def prepare_request(self, resource_path, path_params=None,
+                        query_params=None, header_params=None, body=None,
+                        post_params=None, files=None, auth_settings=None,
+                        collection_formats=None):
+        """Serializes the parameters of a request.
+
+        :return: url, query parameters, headers, post parameters and body,
+            ready to be sent by the REST client.
+        """
         config = self.configuration
 
         # header parameters
@@ -154,19 +188,21 @@ class ApiClient(object):
         # request url
         url = self.configuration.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
+        return url, query_params, header_params, post_params, body
 
+    def handle_response(self, response_data, response_type=None,
+                        _return_http_data_only=None, _preload_content=True,
+                        _raw_response=None):
+        """Deserializes the response of a request made by `__call_api`."""
         self.last_response = response_data
 
         return_data = response_data
         if _preload_content:
             # deserialize response data
-            if response_type:
+            if _raw_response:
+                return_data = self.deserialize_raw(response_data,
+                                                   _raw_response)
+            elif response_type:
                 return_data = self.deserialize(response_data, response_type)
             else:
                 return_data = None
@@ -241,6 +277,48 @@ class ApiClient(object):
 
         return self.__deserialize(data, response_type)
 
+    def deserialize_raw(self, response, fields=True):
+        """Parses the JSON of a response without building models.
+
+        :param response: RESTResponse object to be parsed.
+        :param fields: True for the whole document, or a list of the fields
+            to keep. Fields are JSON keys (not model attribute names);
+            nested fields are separated by dots, e.g.
+            `properties.error.message`.
+
+        :return: dict, list or str.
+        """
+        try:
+            data = json.loads(response.data)
+        except ValueError:
+            return response.data
+
+        if fields is True or not isinstance(data, dict):
+            return data
+        return self.project(data, fields)
+
+    @staticmethod
+    def project(data, fields):
+        """Copies only `fields` (dotted JSON paths) of `data`.
+
+        Missing fields are left out of the result.
+        """
+        projection = {}
+        for field in fields:
+            keys = field.split('.')
+            source = data
+            for key in keys[:-1]:
+                source = source.get(key)
+                if not isinstance(source, dict):
+                    break
+            else:
+                if keys[-1] in source:
+                    target = projection
+                    for key in keys[:-1]:
+                        target = target.setdefault(key, {})
+                    target[keys[-1]] = source[keys[-1]]
+        return projection
+
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
@@ -249,43 +327,98 @@ class ApiClient(object):
 
         :return: object.
         """
-        if data is None:
-            return None
+        return self.deserializer_for(klass)(data)
+
+    @classmethod
+    def deserializer_for(cls, klass):
+        """Returns the compiled deserializer of a type.
+
+        The type string is parsed, and the model classes it names are looked
+        up, only the first time the type is seen. The resulting function is
+        cached and shared by all clients, so later responses of the same type
+        skip the regular expressions and the per-instance walk of
+        `swagger_types` and `attribute_map`.
+
+        :param klass: class literal, or string of class name.
+        :return: function that deserializes dict, list or str into an object
+            (None is returned as is).
+        """
+        deserializer = cls._deserializers.get(klass)
+        if deserializer is None:
+            with cls._deserializers_lock:
+                deserializer = cls._deserializers.get(klass)
+                if deserializer is None:
+                    # a model that refers to itself, being compiled
+                    deserializer = cls._compiling.get(klass)
+                if deserializer is None:
+                    deserializer = cls.__publish(klass)
+        return deserializer
+
+    @classmethod
+    def __publish(cls, klass):
+        """Compiles the deserializer of a type and caches it.
+
+        Deserializers compiled while a model is being compiled may call that
+        model's deserializer before its attributes are set, so they are kept
+        in `_compiling` and only published, with the model's, once the
+        outermost compilation is complete: the lock-free read of
+        `deserializer_for` never returns a half-built deserializer.
+        Must be called with `_deserializers_lock` held.
+        """
+        outermost = not cls._compiling
+        try:
+            deserializer = cls.__compile(klass)
+            if outermost:
+                cls._deserializers.update(cls._compiling)
+                cls._deserializers[klass] = deserializer
+            else:
+                cls._compiling[klass] = deserializer
+        finally:
+            if outermost:
+                cls._compiling.clear()
+        return deserializer
+
+    @classmethod
+    def __compile(cls, klass):
+        """Builds the deserializer of a type.
 
+        :param klass: class literal, or string of class name.
+        :return: function.
+        """
         if type(klass) == str:
             if klass.startswith('list['):
                 sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                return cls.__compile_list(cls.deserializer_for(sub_kls))
 
             if klass.startswith('dict('):
                 sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
+                return cls.__compile_dict(cls.deserializer_for(sub_kls))
 
             # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+            if klass in cls.NATIVE_TYPES_MAPPING:
+                klass = cls.NATIVE_TYPES_MAPPING[klass]
             else:
                 klass = getattr(swagger_client.models, klass)
+            return cls.deserializer_for(klass)
 
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+        if klass in cls.PRIMITIVE_TYPES:
+            return cls.__compile_primitive(klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return cls.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return cls.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
+            return cls.__deserialize_datatime
         else:
-            return self.__deserialize_model(data, klass)
+            return cls.__compile_model(klass)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None):
+                 _preload_content=True, _request_timeout=None,
+                 _raw_response=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async request, set the async_req parameter.
@@ -315,6 +448,9 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _raw_response: if True, the parsed JSON is returned instead of
+                              a model of `response_type`. A list of fields
+                              (see `deserialize_raw`) returns only those.
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
@@ -328,7 +464,8 @@ class ApiClient(object):
                                    body, post_params, files,
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout)
+                                   _preload_content, _request_timeout,
+                                   _raw_response)
         else:
             thread = self.pool.apply_async(self.__call_api, (resource_path,
                                            method, path_params, query_params,
@@ -337,7 +474,8 @@ class ApiClient(object):
                                            response_type, auth_settings,
                                            _return_http_data_only,
                                            collection_formats,
-                                           _preload_content, _request_timeout))
+                                           _preload_content, _request_timeout,
+                                           _raw_response))
         return thread
 
     def request(self, method, url, query_params=None, headers=None,
@@ -539,34 +677,58 @@ class ApiClient(object):
 
         return path
 
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return six.text_type(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
+    @staticmethod
+    def __compile_list(deserialize_item):
+        def deserialize_list(data):
+            if data is None:
+                return None
+            return [deserialize_item(sub_data) for sub_data in data]
+        return deserialize_list
+
+    @staticmethod
+    def __compile_dict(deserialize_value):
+        def deserialize_dict(data):
+            if data is None:
+                return None
+            return {k: deserialize_value(v) for k, v in six.iteritems(data)}
+        return deserialize_dict
+
+    @staticmethod
+    def __compile_primitive(klass):
+        def deserialize_primitive(data):
+            """Deserializes string to primitive type.
+
+            :param data: str.
+
+            :return: int, long, float, str, bool.
+            """
+            if data is None:
+                return None
+            try:
+                return klass(data)
+            except UnicodeEncodeError:
+                return six.text_type(data)
+            except TypeError:
+                return data
+        return deserialize_primitive
+
+    @staticmethod
+    def __deserialize_object(value):
         """Return a original value.
 
         :return: object.
         """
         return value
 
-    def __deserialize_date(self, string):
+    @staticmethod
+    def __deserialize_date(string):
         """Deserializes string to date.
 
         :param string: str.
         :return: date.
         """
+        if string is None:
+            return None
         try:
             from dateutil.parser import parse
             return parse(string).date()
@@ -578,7 +740,8 @@ class ApiClient(object):
                 reason="Failed to parse `{0}` as date object".format(string)
             )
 
-    def __deserialize_datatime(self, string):
+    @staticmethod
+    def __deserialize_datatime(string):
         """Deserializes string to datetime.
 
         The string should be in iso8601 datetime format.
@@ -586,6 +749,8 @@ class ApiClient(object):
         :param string: str.
         :return: datetime.
         """
+        if string is None:
+            return None
         try:
             from dateutil.parser import parse
             return parse(string)
@@ -600,40 +765,52 @@ class ApiClient(object):
                 )
             )
 
-    def __hasattr(self, object, name):
-        return name in object.__class__.__dict__
+    @classmethod
+    def __compile_model(cls, klass):
+        """Builds the deserializer of a model.
 
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
+        The deserializer is registered in `_compiling` before the attributes
+        are compiled, so that models that refer to themselves resolve to it.
+        All the models share one configuration instead of building their own.
 
-        :param data: dict, list.
         :param klass: class literal.
-        :return: model object.
+        :return: function from list or dict to model object.
         """
-
-        if (not klass.swagger_types and
-                not self.__hasattr(klass, 'get_real_child_model')):
-            return data
-
-        kwargs = {}
+        has_real_child_model = 'get_real_child_model' in klass.__dict__
+        if not klass.swagger_types and not has_real_child_model:
+            return cls.__deserialize_object
+
+        # (attribute, json key, deserializer) of each attribute of the model
+        attributes = []
+        keeps_extra_keys = issubclass(klass, dict)
+        if cls._model_configuration is None:
+            cls._model_configuration = Configuration()
+        configuration = cls._model_configuration
+
+        def deserialize_model(data):
+            if data is None:
+                return None
+            kwargs = {}
+            if isinstance(data, (list, dict)):
+                for attr, key, deserialize in attributes:
+                    if key in data:
+                        kwargs[attr] = deserialize(data[key])
+
+            instance = klass(_configuration=configuration, **kwargs)
+
+            if keeps_extra_keys and isinstance(data, dict):
+                for key, value in data.items():
+                    if key not in klass.swagger_types:
+                        instance[key] = value
+            if has_real_child_model:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    instance = cls.deserializer_for(klass_name)(data)
+            return instance
+
+        cls._compiling[klass] = deserialize_model
         if klass.swagger_types is not None:
             for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
+                attributes.append((attr, klass.attribute_map[attr],
+                                   cls.deserializer_for(attr_type)))
+        return deserialize_model
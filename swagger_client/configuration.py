@@ -90,6 +90,19 @@ class Configuration(object):
         # requests to the same host, which is often the case here.
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        # Number of hosts whose connection pools are kept.
+        self.connection_pools = 4
+        # Share one urllib3 pool manager between all the clients of the
+        # process that have the same connection settings, so connections and
+        # TLS sessions are reused across clients (see rest.get_pool_manager).
+        self.share_connection_pool = True
+        # Set TCP keep-alive on the connections, so idle pooled connections
+        # are not silently dropped between requests.
+        self.socket_keepalive = True
+        # Retries of failed connections and of idempotent requests answered
+        # with 429 or 5xx: an int, a urllib3.Retry or None for urllib3's
+        # default.
+        self.retries = None
 
         # Proxy URL
         self.proxy = None
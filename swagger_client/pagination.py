@@ -0,0 +1,123 @@
+# coding: utf-8
+
+"""
+    Speech to Text API v3.0
+
+    Pagination of the listings of the Speech to Text API v3.0. Not generated.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import inspect
+
+from six.moves.urllib.parse import parse_qsl, urlsplit
+
+AUTH_SETTINGS = ['apiKeyHeader', 'apiKeyQuery']
+
+
+class Paginator(object):
+    """Iterates over all items of a paginated listing.
+
+    Page N+1 is requested in the background (on the thread pool of the
+    ApiClient) as soon as page N arrives, so the network round trip of a page
+    overlaps with the consumption of the previous one.
+
+    >>> for transcription in Paginator(api.get_transcriptions, top=100):
+    ...     print(transcription.status)
+
+    Pages can also be consumed from a coroutine with `async for`; waiting for
+    a page then does not block the event loop. With an AsyncApiClient
+    (swagger_client.aio), pages are fetched by tasks of the event loop
+    instead of threads.
+
+    :param list_method: a listing method of DefaultApi, e.g.
+        `api.get_transcriptions` or `api.get_transcription_files`.
+    :param args: positional arguments of `list_method` (e.g. the id).
+    :param top: number of items per page requested from the service.
+    :param kwargs: other arguments of `list_method`. With `_raw_response`,
+        pages and items are the parsed JSON (see `ApiClient.deserialize_raw`).
+    """
+
+    def __init__(self, list_method, *args, **kwargs):
+        self.list_method = list_method
+        self.api_client = list_method.__self__.api_client
+        self.args = args
+        if kwargs.get('top') is None:
+            kwargs.pop('top', None)
+        self.kwargs = kwargs
+        self.raw = bool(kwargs.get('_raw_response'))
+        self.response_type = None
+
+    def __iter__(self):
+        pending = self.first_page()
+        while pending is not None:
+            page = pending.get()
+            pending = self.next_page(page)
+            for item in self.values(page):
+                yield item
+
+    def __aiter__(self):
+        return self.iterate_async()
+
+    async def iterate_async(self):
+        loop = asyncio.get_event_loop()
+        pending = self.schedule(self.first_page())
+        while pending is not None:
+            if isinstance(pending, asyncio.Future):
+                page = await pending
+            else:
+                page = await loop.run_in_executor(None, pending.get)
+            pending = self.schedule(self.next_page(page))
+            for item in self.values(page):
+                yield item
+
+    @staticmethod
+    def schedule(pending):
+        # coroutines of an AsyncApiClient only run once they are scheduled
+        if inspect.isawaitable(pending):
+            return asyncio.ensure_future(pending)
+        return pending
+
+    def first_page(self):
+        return self.list_method(*self.args, async_req=True, **self.kwargs)
+
+    def next_page(self, page):
+        """Starts fetching the page after `page`, if there is one.
+
+        :return: the request thread, or None after the last page.
+        """
+        if self.response_type is None and not self.raw:
+            self.response_type = type(page).__name__
+        next_link = page.get('@nextLink') if self.raw else page.next_link
+        if not next_link:
+            return None
+        resource_path, query_params = self.split_link(next_link)
+        return self.api_client.call_api(
+            resource_path, 'GET',
+            query_params=query_params,
+            header_params={'Accept': 'application/json'},
+            response_type=self.response_type,
+            auth_settings=AUTH_SETTINGS,
+            async_req=True,
+            _return_http_data_only=True,
+            _request_timeout=self.kwargs.get('_request_timeout'),
+            _raw_response=self.kwargs.get('_raw_response'))
+
+    def split_link(self, link):
+        """Splits an absolute next link into the resource path (relative to
+        the host of the configuration) and the query parameters.
+        """
+        host = urlsplit(self.api_client.configuration.host)
+        url = urlsplit(link)
+        base_path = host.path.rstrip('/')
+        if (url.scheme, url.netloc) != (host.scheme, host.netloc) or \
+                not url.path.startswith(base_path):
+            raise ValueError(
+                "Next link `{0}` is not under the host `{1}`".format(
+                    link, self.api_client.configuration.host))
+        return (url.path[len(base_path):],
+                parse_qsl(url.query, keep_blank_values=True))
+
+    def values(self, page):
+        return (page.get('values') or []) if self.raw else (page.values or [])
@@ -17,7 +17,9 @@ import io
 import json
 import logging
 import re
+import socket
 import ssl
+import threading
 
 import certifi
 # python 2 and python 3 compatibility library
@@ -32,6 +34,56 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_pool_managers = {}
+_pool_managers_lock = threading.Lock()
+
+
+def get_retries(retries):
+    """Builds the urllib3 retry policy of `Configuration.retries`."""
+    if retries is None or isinstance(retries, urllib3.Retry):
+        return retries
+    # idempotent methods only (urllib3's default), honouring Retry-After
+    return urllib3.Retry(total=retries, backoff_factor=0.5,
+                         status_forcelist=RETRY_STATUS,
+                         raise_on_status=False)
+
+
+def get_pool_manager(pools_size, maxsize, proxy=None, socket_keepalive=False,
+                     **pool_args):
+    """Returns the process-wide pool manager of these connection settings.
+
+    Pool managers are thread-safe, so every client (and any other code that
+    makes plain HTTP requests, e.g. to download results) with the same
+    settings shares the same connections.
+    """
+    # the repr of a Retry only shows the counts, so all of its settings are
+    # part of the key
+    key = (pools_size, maxsize, proxy, socket_keepalive,
+           tuple(sorted((k, repr(sorted(vars(v).items()))
+                         if isinstance(v, urllib3.Retry) else repr(v))
+                        for k, v in six.iteritems(pool_args))))
+    with _pool_managers_lock:
+        if key not in _pool_managers:
+            _pool_managers[key] = new_pool_manager(
+                pools_size, maxsize, proxy=proxy,
+                socket_keepalive=socket_keepalive, **pool_args)
+        return _pool_managers[key]
+
+
+def new_pool_manager(pools_size, maxsize, proxy=None, socket_keepalive=False,
+                     **pool_args):
+    if socket_keepalive:
+        pool_args['socket_options'] = (
+            urllib3.connection.HTTPConnection.default_socket_options +
+            [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+    if proxy:
+        return urllib3.ProxyManager(num_pools=pools_size, maxsize=maxsize,
+                                    proxy_url=proxy, **pool_args)
+    return urllib3.PoolManager(num_pools=pools_size, maxsize=maxsize,
+                               **pool_args)
+
 
 class RESTResponse(io.IOBase):
 
@@ -52,7 +104,7 @@ class RESTResponse(io.IOBase):
 
 class RESTClientObject(object):
 
-    def __init__(self, configuration, pools_size=4, maxsize=None):
+    def __init__(self, configuration, pools_size=None, maxsize=None):
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -76,6 +128,12 @@ class RESTClientObject(object):
         if configuration.assert_hostname is not None:
             addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
 
+        if configuration.retries is not None:
+            addition_pool_args['retries'] = get_retries(configuration.retries)
+
+        if pools_size is None:
+            pools_size = configuration.connection_pools
+
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
                 maxsize = configuration.connection_pool_maxsize
@@ -83,21 +141,24 @@ class RESTClientObject(object):
                 maxsize = 4
 
         # https pool manager
-        if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
+        if configuration.share_connection_pool:
+            self.pool_manager = get_pool_manager(
+                pools_size,
+                maxsize,
+                proxy=configuration.proxy,
+                socket_keepalive=configuration.socket_keepalive,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
                 key_file=configuration.key_file,
-                proxy_url=configuration.proxy,
                 **addition_pool_args
             )
         else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
+            self.pool_manager = new_pool_manager(
+                pools_size,
+                maxsize,
+                proxy=configuration.proxy,
+                socket_keepalive=configuration.socket_keepalive,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
@@ -0,0 +1,79 @@
+import unittest
+
+from transcriber_parser import stitch_transcript, stitch_words
+
+SECTION_LENGTH = 10000
+
+
+def make_words(*words):
+    return [{'seq_num': seq_num, 'word': word, 'start_time': start_time, 'end_time': end_time}
+            for seq_num, (word, start_time, end_time) in enumerate(words, start=1)]
+
+
+def absolute_words(stitched):
+    return [(word['seq_num'], word['word'], word['start_time'] + (section - 1) * SECTION_LENGTH)
+            for section in sorted(stitched) for word in stitched[section]]
+
+
+class StitchWordsTest(unittest.TestCase):
+    def test_no_overlap(self):
+        sections = {1: make_words(('one', 1000, 1500), ('two', 8000, 8500)),
+                    2: make_words(('three', 500, 1000), ('four', 9000, 9500))}
+        stitched = stitch_words(sections=sections, section_length=SECTION_LENGTH)
+        self.assertEqual(absolute_words(stitched),
+                         [(1, 'one', 1000), (2, 'two', 8000), (3, 'three', 10500), (4, 'four', 19000)])
+        self.assertEqual(stitched[2][0], {'seq_num': 3, 'word': 'three', 'start_time': 500, 'end_time': 1000})
+
+    def test_overlap(self):
+        # the recording of section 1 runs into section 2: both transcribed "c d"
+        sections = {1: make_words(('a', 1000, 1500), ('b', 9000, 9500), ('c', 10200, 10600), ('d', 11000, 11400)),
+                    2: make_words(('c', 200, 600), ('d', 1000, 1400), ('e', 3000, 3500))}
+        stitched = stitch_words(sections=sections, section_length=SECTION_LENGTH)
+        self.assertEqual([word for _, word, _ in absolute_words(stitched)], ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual([seq_num for seq_num, _, _ in absolute_words(stitched)], [1, 2, 3, 4, 5])
+
+    def test_word_straddling_the_cut(self):
+        # "cut" is heard by both sections, starting 300 ms apart: the two transcriptions are kept only once
+        sections = {1: make_words(('before', 8000, 8500), ('cut', 9700, 10400)),
+                    2: make_words(('Cut,', 0, 400), ('after', 1000, 1500))}
+        stitched = stitch_words(sections=sections, section_length=SECTION_LENGTH)
+        self.assertEqual([word for _, word, _ in absolute_words(stitched)], ['before', 'cut', 'after'])
+
+    def test_section_emptied_by_stitching(self):
+        # the only word of section 2 is heard within the last word of section 1
+        sections = {1: make_words(('a', 9000, 9400), ('b', 10000, 12000)),
+                    2: make_words(('b', 0, 400)),
+                    3: make_words(('d', 500, 900))}
+        stitched = stitch_words(sections=sections, section_length=SECTION_LENGTH)
+        self.assertEqual(stitched[2], [])
+        self.assertEqual([word for _, word, _ in absolute_words(stitched)], ['a', 'b', 'd'])
+
+
+class StitchTranscriptTest(unittest.TestCase):
+    def test_speaker_types_of_the_same_part(self):
+        # the interviewee and the interviewer of a part are transcribed separately, into the same word partitions
+        interviewee = stitch_transcript(protagonist_sections={1: make_words(('answer', 1000, 1500))},
+                                        non_protagonist_sections={1: []},
+                                        speaker_type='interviewee', section_length=SECTION_LENGTH)
+        interviewer = stitch_transcript(protagonist_sections={1: []},
+                                        non_protagonist_sections={1: make_words(('question', 500, 900))},
+                                        speaker_type='interviewer', section_length=SECTION_LENGTH)
+        self.assertEqual(list(interviewee), [1])
+        self.assertEqual(list(interviewer), [0])
+        self.assertEqual([word['word'] for word in interviewee[1][1]], ['answer'])
+        self.assertEqual([word['word'] for word in interviewer[0][1]], ['question'])
+
+    def test_both(self):
+        stitched = stitch_transcript(protagonist_sections={1: make_words(('answer', 1000, 1500))},
+                                     non_protagonist_sections={1: make_words(('question', 500, 900))},
+                                     speaker_type='both', section_length=SECTION_LENGTH)
+        self.assertEqual(sorted(stitched), [0, 1])
+
+    def test_invalid_speaker_type(self):
+        with self.assertRaises(TypeError):
+            stitch_transcript(protagonist_sections={}, non_protagonist_sections={}, speaker_type='narrator',
+                              section_length=SECTION_LENGTH)
+
+
+if __name__ == '__main__':
+    unittest.main()
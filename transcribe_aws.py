@@ -1,4 +1,3 @@
-import boto3
 import time
 import uuid
 from botocore.exceptions import ClientError
@@ -6,10 +5,18 @@ from enum import Enum
 import logging
 import botocore.waiter
 import requests
+from pathlib import Path
+from s3_transfer import create_bucket, upload_file, get_s3_resource, get_session, get_transfer_config
 
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Where jobs that write their transcript to our bucket put it before it is copied to its partition, in one folder per
+# job. Transcribe also writes a write-access check file (.write_access_check_file.temp) in the folder of the output,
+# so the whole folder is deleted once the transcript is copied.
+OUTPUT_STAGING_PREFIX = 'transcript_staging'
+
 
 class WaitState(Enum):
     SUCCESS = 'success'
@@ -133,7 +140,7 @@ class TranscribeCompleteWaiter(CustomWaiter):
 
 def start_job(
         job_name, media_uri, media_format, language_code, speaker_type, transcribe_client,
-        vocabulary_name=None):
+        vocabulary_name=None, output_bucket_name=None, output_key=None):
     """
     Starts a transcription job. This function returns as soon as the job is started.
     To get the current status of the job, call get_transcription_job. The job is
@@ -149,6 +156,9 @@ def start_job(
     :param transcribe_client: The Boto3 Transcribe client.
     :param vocabulary_name: The name of a custom vocabulary to use when transcribing
                             the audio file.
+    :param output_bucket_name: The bucket where the transcript is written. If None, it is
+                               kept by the service and served from TranscriptFileUri.
+    :param output_key: The key of the transcript in `output_bucket_name`.
     :return: Data about the job.
     """
     try:
@@ -166,6 +176,10 @@ def start_job(
             job_args['Settings']['MaxSpeakerLabels'] = 2
         if vocabulary_name is not None:
             job_args['Settings']['VocabularyName'] = vocabulary_name
+        if output_bucket_name is not None:
+            job_args['OutputBucketName'] = output_bucket_name
+            if output_key is not None:
+                job_args['OutputKey'] = output_key
         response = transcribe_client.start_transcription_job(**job_args)
         job = response['TranscriptionJob']
         logger.info("Started transcription job %s.", job_name)
@@ -213,33 +227,94 @@ def delete_job(job_name, transcribe_client):
         raise
 
 
+def delete_finished_job(job_name, transcribe_client):
+    """
+    Deletes a job once its transcript has been retrieved, or once it failed. A job that cannot be deleted (e.g. it
+    was never started) is only logged, so that it does not hide the error of the job.
+    """
+    try:
+        delete_job(job_name, transcribe_client)
+    except ClientError:
+        pass
+
+
 def upload_audio_file(filepath, service_config):
     bucket_name = str(uuid.uuid4())
-    location = {'LocationConstraint': service_config['region']}
-    s3_resource = boto3.resource('s3', region_name=service_config['region'])
-    bucket = s3_resource.create_bucket(Bucket=bucket_name, CreateBucketConfiguration=location)
+    create_bucket(bucket_name=bucket_name, region=service_config['region'], service_config=service_config)
+
+    media_object_key = f"audio{Path(filepath).suffix}"
+    upload_file(filepath=filepath, bucket_name=bucket_name, key=media_object_key,
+                region=service_config['region'], service_config=service_config)
+    return f"{bucket_name}/{media_object_key}"
+
 
-    media_object_key = "audio.wav"
-    bucket.upload_file(filepath, media_object_key)
-    return bucket_name
+def run_job(job_name, identifier, language, speaker_type, transcribe_client, output_bucket_name=None,
+            output_key=None):
+    logging.info(f"Starting transcription job {job_name}.")
+    start_job(job_name, f's3://{identifier}', Path(identifier).suffix[1:], language, speaker_type,
+              transcribe_client, output_bucket_name=output_bucket_name, output_key=output_key)
+    transcribe_waiter = TranscribeCompleteWaiter(transcribe_client)
+    transcribe_waiter.wait(job_name)
+    return get_job(job_name, transcribe_client)
 
 
 def retrieve_transcript(identifier, language, speaker_type, service_config):
-    transcribe_client = boto3.client('transcribe')
+    transcribe_client = get_session().client('transcribe')
     job_name_simple = f'Alex-Transcript-{time.time_ns()}'
-    logging.info(f"Starting transcription job {job_name_simple}.")
-    start_job(job_name_simple, f's3://{identifier}/audio.wav', 'wav', language, speaker_type, transcribe_client)
-    transcribe_waiter = TranscribeCompleteWaiter(transcribe_client)
-    transcribe_waiter.wait(job_name_simple)
-    job_simple = get_job(job_name_simple, transcribe_client)
+    job_simple = run_job(job_name_simple, identifier, language, speaker_type, transcribe_client)
     transcript_simple = requests.get(job_simple['Transcript']['TranscriptFileUri']).json()
     logging.info("Deleting demo jobs.")
     delete_job(job_name_simple, transcribe_client)
     return transcript_simple
 
 
+def retrieve_transcript_stream(identifier, language, speaker_type, service_config):
+    """
+    Like retrieve_transcript, but yields the transcript as the chunks of bytes of the JSON document while it is
+    downloaded from TranscriptFileUri, so that it never has to be held in memory. The first chunk is yielded once
+    the job has finished. The job is deleted when the generator is exhausted or closed, and also if it fails.
+    """
+    transcribe_client = get_session().client('transcribe')
+    job_name_simple = f'Alex-Transcript-{time.time_ns()}'
+    try:
+        job_simple = run_job(job_name_simple, identifier, language, speaker_type, transcribe_client)
+        with requests.get(job_simple['Transcript']['TranscriptFileUri'], stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+    finally:
+        logging.info("Deleting demo jobs.")
+        delete_finished_job(job_name_simple, transcribe_client)
+
+
+def retrieve_transcript_to_s3(identifier, language, speaker_type, service_config, s3_bucket, s3_key):
+    """
+    Has the job write the transcript directly to `s3_bucket`, under a staging key, and copies it to `s3_key` on the
+    server side: the transcript is neither downloaded nor uploaded by the worker. Transcribe must be allowed to
+    write to `s3_bucket` (s3:PutObject in the bucket policy or in the role of the caller). The transcript is
+    copied as is, so it is not compressed and does not have `metadata_internet_scholar`. The staging folder of the
+    job and the job itself are deleted even if the job or the copy fails.
+    """
+    transcribe_client = get_session().client('transcribe')
+    job_name_simple = f'Alex-Transcript-{time.time_ns()}'
+    staging_prefix = f"{service_config.get('output_staging_prefix', OUTPUT_STAGING_PREFIX)}/{job_name_simple}/"
+    staging_key = f"{staging_prefix}transcript.json"
+    copy_config = get_transfer_config(service_config)
+    s3_resource = get_s3_resource(max_concurrency=copy_config.max_concurrency)
+    try:
+        run_job(job_name_simple, identifier, language, speaker_type, transcribe_client,
+                output_bucket_name=s3_bucket, output_key=staging_key)
+        logging.info(f"Copy transcript to {s3_key}")
+        s3_resource.Object(s3_bucket, s3_key).copy({'Bucket': s3_bucket, 'Key': staging_key},
+                                                   Config=copy_config)
+    finally:
+        # the transcript and the write-access check file of Transcribe
+        s3_resource.Bucket(s3_bucket).objects.filter(Prefix=staging_prefix).delete()
+        logging.info("Deleting demo jobs.")
+        delete_finished_job(job_name_simple, transcribe_client)
+
+
 def delete_uploaded_file(identifier, service_config):
-    s3_resource = boto3.resource('s3')
-    bucket = s3_resource.Bucket(identifier)
+    s3_resource = get_s3_resource(region=service_config['region'])
+    bucket = s3_resource.Bucket(identifier.split('/')[0])
     bucket.objects.delete()
     bucket.delete()
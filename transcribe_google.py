@@ -1,25 +1,133 @@
 from google.cloud import storage
 from google.cloud import speech_v1p1beta1 as speech
 from google.protobuf.json_format import MessageToDict
+from google.auth.transport.requests import AuthorizedSession
+from google.resumable_media import common
+from google.resumable_media.requests import ResumableUpload
+from google_credentials import get_credentials
+from transcriber_audio import get_content_type
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import logging
+import requests
+import time
 import uuid
-import shutil
-import json
+import io
+import os
+
+STORAGE_ENDPOINT = "https://storage.googleapis.com"
+STORAGE_SCOPE = "https://www.googleapis.com/auth/devstorage.read_write"
+RESUMABLE_UPLOAD_URL = "{endpoint}/upload/storage/v1/b/{bucket}/o?uploadType=resumable"
+RESUMABLE_CHUNK_UNIT = 256 * 1024
+UPLOAD_CHUNK_SIZE = 32 * RESUMABLE_CHUNK_UNIT  # 8 MB
+UPLOAD_MAX_RECOVERIES = 5
+MAX_COMPOSE_SOURCES = 32
+
+_clients = dict()
+_clients_lock = threading.Lock()
 
 
 def upload_audio_file(filepath, service_config):
     storage_client = get_google_client(type="storage", service_config=service_config)
     bucket_name = str(uuid.uuid4())
     bucket = storage_client.create_bucket(bucket_name, location="us")
-    blob = bucket.blob("audio.wav")
-    storage.blob._DEFAULT_CHUNKSIZE = 2097152 # 1024 * 1024 B * 2 = 2 MB
-    storage.blob._MAX_MULTIPART_SIZE = 2097152 # 2 MB
-    blob.upload_from_filename(filepath)
-    return bucket_name
+    chunk_size = get_upload_chunk_size(service_config)
+    blob_name = f"audio{Path(filepath).suffix}"
+    file_size = os.path.getsize(filepath)
+    parts = min(int(service_config.get('upload_parallel_parts', 1)), MAX_COMPOSE_SOURCES)
+    if parts <= 1 or file_size < parts * chunk_size:
+        upload_file_range(filepath=filepath, offset=0, length=file_size, bucket_name=bucket_name,
+                          blob_name=blob_name, service_config=service_config)
+    else:
+        # parallel composite upload: each part is a resumable upload of its own, then GCS concatenates them
+        part_size = -(-file_size // parts)
+        part_size = -(-part_size // chunk_size) * chunk_size
+        offsets = list(range(0, file_size, part_size))
+        part_names = [f"{blob_name}.part{i}" for i in range(len(offsets))]
+        with ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+            futures = [executor.submit(upload_file_range, filepath=filepath, offset=offset,
+                                       length=min(part_size, file_size - offset), bucket_name=bucket_name,
+                                       blob_name=part_name, service_config=service_config)
+                       for offset, part_name in zip(offsets, part_names)]
+            for future in futures:
+                future.result()
+        blob = bucket.blob(blob_name)
+        blob.content_type = get_content_type(filepath)
+        blob.compose([bucket.blob(part_name) for part_name in part_names])
+        for part_name in part_names:
+            bucket.delete_blob(part_name)
+    return f"{bucket_name}/{blob_name}"
+
+
+def get_upload_chunk_size(service_config):
+    # resumable uploads require a multiple of 256 KB
+    chunk_size = int(service_config.get('upload_chunk_size', UPLOAD_CHUNK_SIZE))
+    return max(chunk_size // RESUMABLE_CHUNK_UNIT, 1) * RESUMABLE_CHUNK_UNIT
+
+
+def upload_file_range(filepath, offset, length, bucket_name, blob_name, service_config):
+    """
+    Uploads `length` bytes of `filepath` starting at `offset` in a resumable session. Transient errors are
+    retried by google-resumable-media itself. If a chunk still fails (the session gets out of sync, or the
+    connection is reset or times out), the session is recovered by asking GCS how many bytes it has persisted and
+    resuming from there.
+    """
+    transport = AuthorizedSession(get_credentials(service_config, scopes=[STORAGE_SCOPE]))
+    upload_url = RESUMABLE_UPLOAD_URL.format(endpoint=service_config.get('storage_endpoint', STORAGE_ENDPOINT),
+                                             bucket=bucket_name)
+    with open(filepath, 'rb') as audio_file:
+        stream = FileRange(audio_file, offset, length)
+        upload = ResumableUpload(upload_url, get_upload_chunk_size(service_config))
+        upload.initiate(transport, stream, {'name': blob_name}, get_content_type(filepath), total_bytes=length)
+        recoveries = 0
+        while not upload.finished:
+            try:
+                if upload.invalid:
+                    upload.recover(transport)
+                upload.transmit_next_chunk(transport)
+            except (common.InvalidResponse, requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                recoveries = recoveries + 1
+                if recoveries > UPLOAD_MAX_RECOVERIES:
+                    raise
+                logging.warning(f"Upload of {blob_name} failed at byte {upload.bytes_uploaded}. Recovering session...")
+                # a connection error leaves the session valid, but how much of the chunk GCS persisted is unknown.
+                # recover() only accepts an invalid upload, and there is no public way to invalidate one: this
+                # private method is why requirements_google.txt pins google-resumable-media to 2.x
+                upload._make_invalid()
+                time.sleep(min(2 ** recoveries, 32))
+
+
+class FileRange:
+    """
+    Read-only view of `length` bytes of an open file starting at `offset`, as expected by ResumableUpload.
+    """
+    def __init__(self, file, offset, length):
+        self.file = file
+        self.offset = offset
+        self.length = length
+        self.file.seek(offset)
+
+    def tell(self):
+        return self.file.tell() - self.offset
+
+    def seek(self, position, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            position = position + self.tell()
+        elif whence == io.SEEK_END:
+            position = position + self.length
+        self.file.seek(self.offset + min(max(position, 0), self.length))
+        return self.tell()
+
+    def read(self, size=-1):
+        remaining = self.length - self.tell()
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self.file.read(size)
 
 
 def retrieve_transcript(identifier, language, speaker_type, service_config):
-    gcs_uri = f"gs://{identifier}/audio.wav"
+    gcs_uri = f"gs://{identifier}"
     audio = speech.RecognitionAudio(uri=gcs_uri)
 
     if speaker_type == 'both':
@@ -47,22 +155,25 @@ def retrieve_transcript(identifier, language, speaker_type, service_config):
 
 
 def get_google_client(type, service_config):
-    json_string = json.dumps(service_config)
-    Path('./local_credentials/').mkdir(parents=True, exist_ok=True)
-    temp_file = f"./local_credentials/{uuid.uuid4()}.json"
-    with open(temp_file, 'w', encoding="utf-8") as json_file:
-        json_file.write(json_string)
-    if type == "storage":
-        client = storage.Client.from_service_account_json(temp_file)
-    elif type == "speech":
-        client = speech.SpeechClient.from_service_account_json(temp_file)
-    else:
-        client = None
-    shutil.rmtree('./local_credentials')
-    return client
+    # one authenticated client per (service, account) for the whole process
+    key = (type, service_config['client_email'])
+    with _clients_lock:
+        if key not in _clients:
+            credentials = get_credentials(service_config)
+            if type == "storage":
+                client_options = None
+                if 'storage_endpoint' in service_config:
+                    client_options = {'api_endpoint': service_config['storage_endpoint']}
+                _clients[key] = storage.Client(project=service_config['project_id'], credentials=credentials,
+                                               client_options=client_options)
+            elif type == "speech":
+                _clients[key] = speech.SpeechClient(credentials=credentials)
+            else:
+                return None
+        return _clients[key]
 
 
 def delete_uploaded_file(identifier, service_config):
     storage_client = get_google_client(type="storage", service_config=service_config)
-    bucket = storage_client.get_bucket(identifier)
+    bucket = storage_client.get_bucket(identifier.split('/')[0])
     bucket.delete(force=True)
@@ -2,43 +2,26 @@ from ibm_watson import SpeechToTextV1
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from time import sleep
 import json
-import boto3
+from s3_transfer import create_bucket, upload_file, get_s3_resource
+from transcriber_audio import get_content_type
 import uuid
 from pathlib import Path
 import logging
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 def upload_audio_file(filepath, service_config):
     bucket_name = str(uuid.uuid4())
-    location = {'LocationConstraint': service_config['aws_region']}
-    s3_resource = boto3.resource('s3', region_name=service_config['aws_region'])
-    bucket = s3_resource.create_bucket(Bucket=bucket_name, CreateBucketConfiguration=location)
+    create_bucket(bucket_name=bucket_name, region=service_config['aws_region'], service_config=service_config)
 
-    extension = Path(filepath).suffix[1:]
-    if extension == 'wav':
-        media_object_key = "audio.wav"
-    else:
-        media_object_key = "audio.mp3"
-    bucket.upload_file(filepath, media_object_key)
+    media_object_key = f"audio{Path(filepath).suffix}"
+    upload_file(filepath=filepath, bucket_name=bucket_name, key=media_object_key,
+                region=service_config['aws_region'], service_config=service_config)
     return f"{bucket_name}/{media_object_key}"
 
 
 def retrieve_transcript(identifier, language, speaker_type, service_config, phone=False):
-    try:
-        s3_items = identifier.split('/')
-        s3_resource = boto3.resource('s3')
-        bucket = s3_resource.Bucket(s3_items[0])
-        extension = Path(s3_items[1]).suffix[1:]
-        if extension == 'wav':
-            local_file = f"{uuid.uuid4()}.wav"
-            content_type="audio/wav"
-        else:
-            local_file = f"{uuid.uuid4()}.mp3"
-            content_type="audio/mp3"
-        bucket.download_file(s3_items[1], local_file)
-    finally:
-        bucket.objects.delete()
-        bucket.delete()
     authenticator = IAMAuthenticator(service_config["api_key"])
     speech_to_text = SpeechToTextV1(authenticator=authenticator)
 
@@ -49,9 +32,16 @@ def retrieve_transcript(identifier, language, speaker_type, service_config, phon
     else:
         model = f"{language}_BroadbandModel"
 
-    with open(local_file, 'rb') as audio_file:
+    s3_items = identifier.split('/')
+    s3_resource = get_s3_resource(region=service_config['aws_region'])
+    bucket = s3_resource.Bucket(s3_items[0])
+    try:
+        content_type = get_content_type(s3_items[1])
+        # the audio goes straight from S3 to Watson, so the worker disk does not depend on the section size
+        s3_object = s3_resource.Object(s3_items[0], s3_items[1]).get()
+        audio_stream = S3AudioStream(s3_object['Body'], s3_object['ContentLength'])
         recognition_job = speech_to_text.create_job(
-            audio_file,
+            audio_stream,
             model=model,
             content_type=content_type,
             results_ttl=60,
@@ -61,6 +51,9 @@ def retrieve_transcript(identifier, language, speaker_type, service_config, phon
             word_confidence=True,
             profanity_filter=False
         ).get_result()
+    finally:
+        bucket.objects.delete()
+        bucket.delete()
 
     while recognition_job['status'] in ('waiting', 'processing'):
         sleep(1000)
@@ -72,6 +65,27 @@ def retrieve_transcript(identifier, language, speaker_type, service_config, phon
         return recognition_job
 
 
+class S3AudioStream:
+    """
+    File-like wrapper around the body of an S3 object. It has a length, so the request to Watson gets a
+    Content-Length header, and it is read in chunks of at most STREAM_CHUNK_SIZE bytes, so memory use is bounded.
+    """
+    def __init__(self, body, length):
+        self.body = body
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > STREAM_CHUNK_SIZE:
+            size = STREAM_CHUNK_SIZE
+        return self.body.read(size)
+
+    def __iter__(self):
+        return self.body.iter_chunks(chunk_size=STREAM_CHUNK_SIZE)
+
+
 def delete_uploaded_file(identifier, service_config):
     logging.info("Files have already been deleted!")
 
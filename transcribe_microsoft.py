@@ -1,151 +1,230 @@
 import swagger_client as cris_client
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 import time
-import requests
 from azure.storage.blob import BlobServiceClient
 import json
 from datetime import datetime, timedelta
 from azure.storage.blob import generate_blob_sas, BlobSasPermissions
 import uuid
+import os
+from pathlib import Path
+
+UPLOAD_BLOCK_SIZE = 8 * 1024 * 1024
+UPLOAD_MAX_SINGLE_PUT_SIZE = 16 * 1024 * 1024
+UPLOAD_MAX_CONCURRENCY = 8
+UPLOAD_RETRY_TOTAL = 10
+# connections kept open to the Speech API and to the storage that serves the results, and retries of idempotent
+# requests (polls, listings, deletes and downloads) that fail with a connection error, 429 or 5xx
+API_POOL_MAXSIZE = 16
+API_RETRIES = 5
+DELETE_MAX_WORKERS = 8
+PAGE_SIZE = 100
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+_api_clients = dict()
+_api_clients_lock = threading.Lock()
 
 
 # The client was generated via swagger following this instructions:
 # https://docs.microsoft.com/en-us/azure/cognitive-services/speech-service/swagger-documentation
+# Listings are paginated with swagger_client.Paginator, which was added to the generated client.
 
-def _paginate(api, paginated_object):
-    """
-    The autogenerated client does not support pagination. This function returns a generator over
-    all items of the array that the paginated object `paginated_object` is part of.
-    """
-    yield from paginated_object.values
-    typename = type(paginated_object).__name__
-    auth_settings = ["apiKeyHeader", "apiKeyQuery"]
-    while paginated_object.next_link:
-        link = paginated_object.next_link[len(api.api_client.configuration.host):]
-        paginated_object, status, headers = api.api_client.call_api(link, "GET",
-            response_type=typename, auth_settings=auth_settings)
-
-        if status == 200:
-            yield from paginated_object.values
-        else:
-            raise Exception(f"could not receive paginated data: status {status}")
+def delete_transcription(api, transcription_id):
+    logging.debug(f"Deleting transcription with id {transcription_id}")
+    try:
+        api.delete_transcription(transcription_id)
+        return True
+    except cris_client.rest.ApiException as exc:
+        logging.error(f"Could not delete transcription {transcription_id}: {exc}")
+        return False
 
 
-def delete_all_transcriptions(api):
+def delete_all_transcriptions(api, max_workers=DELETE_MAX_WORKERS, page_size=PAGE_SIZE):
     """
     Delete all transcriptions associated with your speech resource.
     """
     logging.info("Deleting all existing completed transcriptions.")
 
-    # get all transcriptions for the subscription
-    transcriptions = list(_paginate(api, api.get_transcriptions()))
-
-    # Delete all pre-existing completed transcriptions.
+    # Pages are streamed: the transcriptions of a page are deleted by `max_workers` concurrent requests while the
+    # next page is fetched. Pages are addressed by offset, so deleting shifts the items that were not listed yet
+    # towards pages that were already read; the sweep is repeated until a pass deletes nothing.
     # If transcriptions are still running or not started, they will not be deleted.
-    for transcription in transcriptions:
-        transcription_id = transcription._self.split('/')[-1]
-        logging.debug(f"Deleting transcription with id {transcription_id}")
-        try:
-            api.delete_transcription(transcription_id)
-        except cris_client.rest.ApiException as exc:
-            logging.error(f"Could not delete transcription {transcription_id}: {exc}")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        deleted = True
+        while deleted:
+            futures = [executor.submit(delete_transcription, api, transcription['self'].split('/')[-1])
+                       for transcription in cris_client.Paginator(api.get_transcriptions, top=page_size,
+                                                                  _raw_response=True)]
+            deleted = any([future.result() for future in futures])
+
+
+def get_api(service_config):
+    """
+    Returns the Speech API client of `service_config`. Clients are cached per region and key, and all of them
+    share the process-wide urllib3 pool manager of swagger_client, so connections (and TLS sessions) are reused
+    across polls, pages and jobs.
+    """
+    key = (service_config['service_region'], service_config['subscription_key'])
+    with _api_clients_lock:
+        if key not in _api_clients:
+            # configure API key authorization: subscription_key
+            configuration = cris_client.Configuration()
+            configuration.api_key["Ocp-Apim-Subscription-Key"] = service_config['subscription_key']
+            configuration.host = f"https://{service_config['service_region']}.api.cognitive.microsoft.com/" \
+                                 f"speechtotext/v3.0"
+            configuration.connection_pool_maxsize = int(service_config.get('api_pool_maxsize', API_POOL_MAXSIZE))
+            configuration.retries = int(service_config.get('api_retries', API_RETRIES))
+
+            # create the client object and an instance of the transcription api class
+            _api_clients[key] = cris_client.DefaultApi(api_client=cris_client.ApiClient(configuration))
+        return _api_clients[key]
 
 
 def upload_audio_file(filepath, service_config):
-    blob_service_client = BlobServiceClient.from_connection_string(service_config['connection_string'])
+    # Files above the single-put threshold are split in blocks that are staged by `max_concurrency` parallel
+    # connections. Each block is an independent request, so the SDK retry policy retries failed blocks
+    # individually before the block list is committed.
+    blob_service_client = BlobServiceClient.from_connection_string(
+        service_config['connection_string'],
+        max_block_size=int(service_config.get('upload_block_size', UPLOAD_BLOCK_SIZE)),
+        max_single_put_size=int(service_config.get('upload_max_single_put_size', UPLOAD_MAX_SINGLE_PUT_SIZE)),
+        retry_total=int(service_config.get('upload_retry_total', UPLOAD_RETRY_TOTAL)))
     container_name = str(uuid.uuid4())
     container_client = blob_service_client.get_container_client(container_name)
     container_client.create_container()
-    blob_client = container_client.get_blob_client('audio.wav')
+    blob_name = f"audio{Path(filepath).suffix}"
+    blob_client = container_client.get_blob_client(blob_name)
     with open(filepath, "rb") as data:
-        blob_client.upload_blob(data, blob_type="BlockBlob")
-    return container_name
+        blob_client.upload_blob(data, blob_type="BlockBlob", length=os.path.getsize(filepath),
+                                max_concurrency=int(service_config.get('upload_max_concurrency',
+                                                                       UPLOAD_MAX_CONCURRENCY)))
+    return f"{container_name}/{blob_name}"
 
 
-def retrieve_transcript(identifier, language, speaker_type, service_config):
+def start_transcription(api, identifier, language, speaker_type, service_config):
     blob_service_client = BlobServiceClient.from_connection_string(service_config['connection_string'])
-    container_client = blob_service_client.get_container_client(identifier)
-    blob_client = container_client.get_blob_client('audio.wav')
+    container_name, blob_name = identifier.split('/')
+    container_client = blob_service_client.get_container_client(container_name)
+    blob_client = container_client.get_blob_client(blob_name)
     sas_blob = generate_blob_sas(account_name=service_config['account_name'],
-                                 container_name=identifier,
-                                 blob_name='audio.wav',
+                                 container_name=container_name,
+                                 blob_name=blob_name,
                                  account_key=service_config['account_key'],
                                  permission=BlobSasPermissions(read=True),
                                  expiry=datetime.utcnow() + timedelta(hours=24))
     uri = blob_client.url + '?' + sas_blob
-    logging.info("Starting transcription client...")
 
-    # configure API key authorization: subscription_key
-    configuration = cris_client.Configuration()
-    configuration.api_key["Ocp-Apim-Subscription-Key"] = service_config['subscription_key']
-    configuration.host = f"https://{service_config['service_region']}.api.cognitive.microsoft.com/speechtotext/v3.0"
+    # Specify transcription properties by passing a dict to the properties parameter. See
+    # https://docs.microsoft.com/azure/cognitive-services/speech-service/batch-transcription#configuration-properties
+    # for supported parameters.
+    properties = {
+        "punctuationMode": "Automatic",
+        "profanityFilterMode": "None",
+        "wordLevelTimestampsEnabled": True,
+        "diarizationEnabled": (speaker_type == "both"),
+        "timeToLive": "PT1H"
+    }
+
+    # Use base models for transcription.
+    transcription_definition = cris_client.Transcription(
+        display_name="Simple transcription",
+        description="Simple transcription description",
+        locale=language,
+        content_urls=[uri],
+        properties=properties
+    )
+
+    created_transcription, status, headers = api.create_transcription_with_http_info(transcription=transcription_definition)
+
+    # get the transcription Id from the location URI
+    transcription_id = headers["location"].split("/")[-1]
+
+    # Log information about the created transcription. If you should ask for support, please
+    # include this information.
+    logging.info(f"Created new transcription with id '{transcription_id}' in region {service_config['service_region']}")
+    return transcription_id
+
+
+def wait_for_results(api, transcription_id):
+    """
+    Waits for the transcription to finish and returns the URL of its transcription file (None if it has none).
+    """
+    logging.info("Checking status.")
+    while True:
+        # wait for 5 seconds before refreshing the transcription status
+        time.sleep(5)
+
+        # only the status (and the error, if any) is read, so no models are built
+        transcription = api.get_transcription(transcription_id,
+                                              _raw_response=['status', 'properties.error.message'])
+        logging.info(f"Transcriptions status: {transcription['status']}")
+
+        if transcription['status'] == "Succeeded":
+            # the listing stops at the first transcription file: a job with a single audio has only one
+            for file_data in cris_client.Paginator(api.get_transcription_files, transcription_id,
+                                                   _raw_response=True):
+                if file_data['kind'] == "Transcription":
+                    return file_data['links']['contentUrl']
+            return None
+        elif transcription['status'] == "Failed":
+            raise Exception(f"Transcription failed: {transcription['properties']['error']['message']}")
+
+
+def delete_transcriptions(api, transcription_id, service_config):
+    # By default only the transcription of this job is deleted (the others expire after their timeToLive).
+    # `"delete_transcriptions": "all"` sweeps every completed transcription of the subscription instead.
+    if service_config.get('delete_transcriptions', 'own') == 'all':
+        delete_all_transcriptions(api, max_workers=int(service_config.get('delete_max_workers',
+                                                                           DELETE_MAX_WORKERS)))
+    elif transcription_id is not None:
+        delete_transcription(api, transcription_id)
 
-    # create the client object and authenticate
-    client = cris_client.ApiClient(configuration)
 
-    # create an instance of the transcription api class
-    api = cris_client.DefaultApi(api_client=client)
+def retrieve_transcript(identifier, language, speaker_type, service_config):
+    logging.info("Starting transcription client...")
+    api = get_api(service_config)
+    transcription_id = None
     try:
-        # Specify transcription properties by passing a dict to the properties parameter. See
-        # https://docs.microsoft.com/azure/cognitive-services/speech-service/batch-transcription#configuration-properties
-        # for supported parameters.
-        properties = {
-            "punctuationMode": "Automatic",
-            "profanityFilterMode": "None",
-            "wordLevelTimestampsEnabled": True,
-            "diarizationEnabled": (speaker_type == "both"),
-            "timeToLive": "PT1H"
-        }
-
-        # Use base models for transcription.
-        transcription_definition = cris_client.Transcription(
-            display_name="Simple transcription",
-            description="Simple transcription description",
-            locale=language,
-            content_urls=[uri],
-            properties=properties
-        )
-
-        created_transcription, status, headers = api.create_transcription_with_http_info(transcription=transcription_definition)
-
-        # get the transcription Id from the location URI
-        transcription_id = headers["location"].split("/")[-1]
-
-        # Log information about the created transcription. If you should ask for support, please
-        # include this information.
-        logging.info(f"Created new transcription with id '{transcription_id}' in region {service_config['service_region']}")
-
-        logging.info("Checking status.")
-
+        transcription_id = start_transcription(api, identifier, language, speaker_type, service_config)
+        results_url = wait_for_results(api, transcription_id)
         transcript = {}
-        completed = False
-        while not completed:
-            # wait for 5 seconds before refreshing the transcription status
-            time.sleep(5)
-
-            transcription = api.get_transcription(transcription_id)
-            logging.info(f"Transcriptions status: {transcription.status}")
-
-            if transcription.status in ("Failed", "Succeeded"):
-                completed = True
-
-            if transcription.status == "Succeeded":
-                pag_files = api.get_transcription_files(transcription_id)
-                for file_data in _paginate(api, pag_files):
-                    if file_data.kind != "Transcription":
-                        continue
-
-                    results_url = file_data.links.content_url
-                    results = requests.get(results_url)
-                    transcript = json.loads(results.content)
-            elif transcription.status == "Failed":
-                raise Exception(f"Transcription failed: {transcription.properties.error.message}")
+        if results_url is not None:
+            # plain GET on the shared pool (no API key is sent to the storage account)
+            results = api.api_client.rest_client.GET(results_url)
+            transcript = json.loads(results.data)
     finally:
-        delete_all_transcriptions(api)
+        delete_transcriptions(api, transcription_id, service_config)
     return transcript
 
 
+def retrieve_transcript_stream(identifier, language, speaker_type, service_config):
+    """
+    Like retrieve_transcript, but yields the transcript as the chunks of bytes of the JSON document while it is
+    downloaded (decompressed if it is served compressed), so that it never has to be held in memory. The first
+    chunk is yielded once the transcription has finished. The transcription is deleted when the generator is
+    exhausted or closed.
+    """
+    logging.info("Starting transcription client...")
+    api = get_api(service_config)
+    transcription_id = None
+    try:
+        transcription_id = start_transcription(api, identifier, language, speaker_type, service_config)
+        results_url = wait_for_results(api, transcription_id)
+        if results_url is None:
+            yield b'{}'
+            return
+        results = api.api_client.rest_client.GET(results_url, _preload_content=False)
+        try:
+            yield from results.stream(DOWNLOAD_CHUNK_SIZE, decode_content=True)
+        finally:
+            results.release_conn()
+    finally:
+        delete_transcriptions(api, transcription_id, service_config)
+
+
 def delete_uploaded_file(identifier, service_config):
     blob_service_client = BlobServiceClient.from_connection_string(service_config['connection_string'])
-    container_client = blob_service_client.get_container_client(identifier)
+    container_client = blob_service_client.get_container_client(identifier.split('/')[0])
     container_client.delete_container()
\ No newline at end of file
@@ -0,0 +1,203 @@
+from pathlib import Path
+import uuid
+
+SILENCE_FRAME_MS = 20
+# A timeframe is the length of a section: a whole number followed by a unit ("45m", "600s"). Plain numbers are
+# hours, which is how sections were sized before sub-hour timeframes existed.
+TIMEFRAME_UNITS = {'h': 60 * 60 * 1000, 'm': 60 * 1000, 's': 1000}
+
+# How sections are encoded for upload. `bytes_per_second` estimates the size of the encoded audio: None means
+# uncompressed PCM (computed from the source), a float below 1 is a ratio of the PCM size (a conservative figure for
+# lossless compression of speech) and a larger number is a constant bitrate.
+AUDIO_FORMATS = {
+    'wav': {
+        'format': 'wav',
+        'content_type': 'audio/wav',
+        'parameters': ['-acodec', 'pcm_s16le'],
+        'bytes_per_second': None
+    },
+    'flac': {
+        'format': 'flac',
+        'content_type': 'audio/flac',
+        'parameters': ['-acodec', 'flac'],
+        'bytes_per_second': 0.7
+    },
+    'ogg': {
+        'format': 'ogg',
+        'content_type': 'audio/ogg;codecs=opus',
+        'parameters': ['-acodec', 'libopus', '-b:a', '64k'],
+        'bytes_per_second': 64000 / 8
+    },
+    'mp3': {
+        'format': 'mp3',
+        'content_type': 'audio/mp3',
+        'parameters': ['-b:a', '128k'],
+        'bytes_per_second': 128000 / 8
+    }
+}
+
+# Formats accepted by each provider in order of preference (lossless first, FLAC wherever it is accepted), the largest
+# file it accepts (None when there is no limit below the length limit of a job) and the sample rate its models use
+# internally. Sections are resampled down to that rate before they are encoded: a higher rate only makes uploads
+# bigger. Resampling does not change the duration, so the offsets of the words are not affected.
+PROVIDER_AUDIO = {
+    'microsoft': {'formats': ['wav', 'ogg', 'mp3'], 'max_size': 1073741824, 'frame_rate': 16000},
+    'google': {'formats': ['flac', 'wav'], 'max_size': None, 'frame_rate': 16000},
+    'aws': {'formats': ['flac', 'wav', 'ogg', 'mp3'], 'max_size': 2147483648, 'frame_rate': 16000},
+    'ibm': {'formats': ['flac', 'wav', 'ogg', 'mp3'], 'max_size': 1073741824, 'frame_rate': 16000}
+}
+
+
+def estimate_size(sound, audio_format):
+    bytes_per_second = AUDIO_FORMATS[audio_format]['bytes_per_second']
+    pcm_size = len(sound.raw_data) + 44  # 44 bytes of WAV header
+    if bytes_per_second is None:
+        return pcm_size
+    elif bytes_per_second < 1:
+        return int(pcm_size * bytes_per_second)
+    else:
+        return int(sound.duration_seconds * bytes_per_second)
+
+
+def choose_audio_format(service, sound):
+    """
+    Returns the first format in the preference list of `service` whose estimated size fits its limit.
+    """
+    provider = PROVIDER_AUDIO[service]
+    for audio_format in provider['formats']:
+        if provider['max_size'] is None or estimate_size(sound, audio_format) < provider['max_size']:
+            return audio_format
+    raise Exception(f"Sections are too long for {service} in any of the formats it accepts "
+                    f"({', '.join(provider['formats'])}). Please use a smaller timeframe.")
+
+
+def get_frame_rate(service, sound):
+    # the rate of the provider's models; sections are never upsampled
+    return min(sound.frame_rate, PROVIDER_AUDIO[service]['frame_rate'])
+
+
+def normalize(sound, frame_rate):
+    # 16-bit mono at `frame_rate`
+    sound = sound.set_channels(1).set_sample_width(2)
+    if sound.frame_rate != frame_rate:
+        sound = sound.set_frame_rate(frame_rate)
+    return sound
+
+
+def normalize_timeframe(timeframe):
+    """
+    Returns the canonical form of `timeframe`, which is what goes into the `timeframe` partitions. It is always
+    expressed in the largest whole unit, so that a section length has only one partition value: "3" for three
+    hours (also given as 3, "3h" or "180m"), "30m" for half an hour (also given as 0.5 or "1800s") and "90s" for a
+    minute and a half.
+    """
+    if isinstance(timeframe, str) and timeframe[-1:] in TIMEFRAME_UNITS:
+        value = timeframe[:-1]
+        if not value.isdigit() or int(value) == 0:
+            raise ValueError(f"Invalid timeframe: {timeframe}")
+        seconds = int(value) * TIMEFRAME_UNITS[timeframe[-1]] // 1000
+    else:
+        hours = float(timeframe)
+        seconds = hours * 60 * 60
+        if hours <= 0 or not seconds.is_integer():
+            raise ValueError(f"Invalid timeframe: {timeframe}")
+        seconds = int(seconds)
+    if seconds % (60 * 60) == 0:
+        return str(seconds // (60 * 60))
+    elif seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    else:
+        return f"{seconds}s"
+
+
+def timeframe_to_ms(timeframe):
+    timeframe = normalize_timeframe(timeframe)
+    if timeframe[-1] in TIMEFRAME_UNITS:
+        return int(timeframe[:-1]) * TIMEFRAME_UNITS[timeframe[-1]]
+    return int(timeframe) * TIMEFRAME_UNITS['h']
+
+
+def find_silence(sound, position, window, frame=SILENCE_FRAME_MS):
+    """
+    Returns the middle of the quietest `frame` ms (lowest RMS energy) of `sound` in [position, position + window),
+    in milliseconds. The energy of all frames of the window is computed at once with numpy.
+    """
+    import numpy
+
+    segment = sound[position:position + window]
+    frame_length = int(segment.frame_rate * frame / 1000) * segment.channels
+    samples = numpy.array(segment.get_array_of_samples(), dtype=numpy.float64)
+    frames = len(samples) // frame_length if frame_length > 0 else 0
+    if frames == 0:
+        return position
+    energy = numpy.mean(samples[:frames * frame_length].reshape(frames, frame_length) ** 2, axis=1)
+    return position + int(numpy.argmin(energy)) * frame + frame // 2
+
+
+def make_sections(sound, section_length, silence_window=0, overlap=0):
+    """
+    Cuts `sound` in sections of about `section_length` ms, like pydub's make_chunks, but moves each cut forward to
+    the quietest point of the following `silence_window` ms, so that words are not split. Each section but the last
+    also carries the first `overlap` ms of the next one; transcriber_parser.stitch_words removes the duplicates.
+
+    The start of section i is padded with silence up to its nominal start (i-1) * section_length. The offset
+    arithmetic of transcriber_local.SELECT_TRANSCRIPT_BATCH, start_time + (section-1) * TIMEFRAME_IN_MS, is
+    therefore still exact. A section can be up to `silence_window` + `overlap` ms longer than `section_length`.
+    """
+    from pydub import AudioSegment
+
+    silence_window = min(silence_window, section_length // 2)
+    boundaries = [0]
+    nominal_start = section_length
+    while nominal_start < len(sound):
+        if silence_window > 0:
+            boundary = find_silence(sound, nominal_start, silence_window)
+        else:
+            boundary = nominal_start
+        if boundary >= len(sound):
+            break
+        boundaries.append(boundary)
+        nominal_start = nominal_start + section_length
+    boundaries.append(len(sound))
+
+    sections = list()
+    for i in range(len(boundaries) - 1):
+        section = sound[boundaries[i]:min(boundaries[i + 1] + overlap, len(sound))]
+        padding = boundaries[i] - i * section_length
+        if padding > 0:
+            section = AudioSegment.silent(duration=padding, frame_rate=sound.frame_rate) + section
+        sections.append(section)
+    return sections
+
+
+def get_content_type(filepath):
+    return AUDIO_FORMATS[Path(filepath).suffix[1:]]['content_type']
+
+
+class SectionExporter:
+    """
+    Encodes sections of an interview for the providers that will transcribe them. Each section is normalized to
+    the provider's sample rate at most once per rate and encoded at most once per (rate, format), from the audio
+    that was already decoded, and the files are written to `folder`.
+    """
+    def __init__(self, sections, folder='./audio/'):
+        self.sections = sections
+        self.folder = folder
+        self.normalized = dict()
+        self.files = dict()
+
+    def export(self, service, section):
+        sound = self.sections[section - 1]  # sections are one-based
+        frame_rate = get_frame_rate(service, sound)
+        if (section, frame_rate) not in self.normalized:
+            self.normalized[(section, frame_rate)] = normalize(sound, frame_rate)
+        sound = self.normalized[(section, frame_rate)]
+        audio_format = choose_audio_format(service, sound)
+        key = (section, frame_rate, audio_format)
+        if key not in self.files:
+            Path(self.folder).mkdir(parents=True, exist_ok=True)
+            filepath = f"{self.folder}{uuid.uuid4()}.{audio_format}"
+            sound.export(filepath, format=AUDIO_FORMATS[audio_format]['format'],
+                         parameters=AUDIO_FORMATS[audio_format]['parameters'])
+            self.files[key] = filepath
+        return self.files[key]
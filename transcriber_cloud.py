@@ -1,8 +1,59 @@
 from internet_scholar import AthenaLogger, read_dict_from_s3, save_data_in_s3
 import argparse
 from collections import OrderedDict
+from itertools import chain
+import codecs
 import logging
 import datetime
+import json
+
+JSON_WHITESPACE = b' \t\r\n'
+
+
+def inject_member(chunks, key, value):
+    """
+    Yields the bytes of the JSON object streamed in `chunks` with `key: value` as its first member. Line breaks
+    are dropped, since the document must fit in one line to be read by Athena: outside of strings they are only
+    whitespace, and inside of strings they are always escaped.
+    """
+    chunks = iter(chunks)
+    head = b''
+    for chunk in chunks:
+        head = head + chunk
+        if codecs.BOM_UTF8.startswith(head):
+            continue  # not enough bytes yet to tell whether the document starts with a BOM
+        body = head[len(codecs.BOM_UTF8):] if head.startswith(codecs.BOM_UTF8) else head
+        body = body.lstrip(JSON_WHITESPACE)
+        if len(body) == 0:
+            continue
+        if body[:1] != b'{':
+            raise Exception("Transcript is not a JSON object")
+        members = body[1:].lstrip(JSON_WHITESPACE)
+        if len(members) == 0:
+            continue
+        member = json.dumps({key: value})[1:-1].encode('utf-8')
+        separator = b'' if members[:1] == b'}' else b','
+        yield (b'{' + member + separator + members).translate(None, b'\r\n')
+        break
+    else:
+        raise Exception("Transcript is not a JSON object")
+    for chunk in chunks:
+        yield chunk.translate(None, b'\r\n')
+
+
+def transcript_key(partitions, filename):
+    return '/'.join(['transcript'] + [f"{name}={value}" for name, value in partitions.items()] + [filename])
+
+
+def save_transcript_stream(chunks, metadata, s3_bucket, partitions):
+    """
+    Streams the transcript in `chunks` to the same object that save_data_in_s3 would write, with `metadata` as its
+    `metadata_internet_scholar`. The transcript is compressed and uploaded while it is downloaded.
+    """
+    from s3_transfer import upload_stream
+
+    upload_stream(inject_member(chunks, 'metadata_internet_scholar', metadata), bucket_name=s3_bucket,
+                  key=transcript_key(partitions, 'transcript.json.bz2'))
 
 
 def main():
@@ -30,13 +81,13 @@ def main():
 
     try:
         if args.service == "microsoft":
-            from transcribe_microsoft import retrieve_transcript, delete_uploaded_file
+            import transcribe_microsoft as transcriber
         elif args.service == "google":
-            from transcribe_google import retrieve_transcript, delete_uploaded_file
+            import transcribe_google as transcriber
         elif args.service == "aws":
-            from transcribe_aws import retrieve_transcript, delete_uploaded_file
+            import transcribe_aws as transcriber
         elif args.service == "ibm":
-            from transcribe_ibm import retrieve_transcript, delete_uploaded_file
+            import transcribe_ibm as transcriber
         else:
             raise Exception(f"Invalid service: {args.service}")
 
@@ -47,14 +98,6 @@ def main():
                 'language': args.language,
                 'audio_storage': args.identifier
             }
-            transcript = retrieve_transcript(identifier=args.identifier,
-                                             language=args.language,
-                                             speaker_type=args.speaker_type,
-                                             service_config=config[args.service])
-            metadata['finished_at'] = str(datetime.datetime.utcnow())
-            transcript['metadata_internet_scholar'] = metadata
-
-            logging.info(f'Succesfully retrieved transcript on {args.service}')
             partitions = OrderedDict()
             partitions['service'] = args.service
             partitions['project'] = args.project
@@ -64,14 +107,60 @@ def main():
             partitions['speaker_type'] = args.speaker_type
             partitions['timeframe'] = args.timeframe
             partitions['section'] = args.section
-            logging.info(f'Save transcript on S3')
-            save_data_in_s3(content=transcript,
-                            s3_bucket=args.bucket,
-                            s3_key='transcript.json',
-                            prefix='transcript',
-                            partitions=partitions)
+            if hasattr(transcriber, 'retrieve_transcript_to_s3') and \
+                    config[args.service].get('output_to_s3', False):
+                # the provider writes the transcript to our bucket itself: it is stored uncompressed as
+                # transcript.json and its metadata goes to a separate object of the same partition
+                transcriber.retrieve_transcript_to_s3(identifier=args.identifier,
+                                                      language=args.language,
+                                                      speaker_type=args.speaker_type,
+                                                      service_config=config[args.service],
+                                                      s3_bucket=args.bucket,
+                                                      s3_key=transcript_key(partitions, 'transcript.json'))
+                metadata['finished_at'] = str(datetime.datetime.utcnow())
+                logging.info(f'Succesfully retrieved transcript on {args.service}')
+                logging.info(f'Save metadata on S3')
+                save_data_in_s3(content={'metadata_internet_scholar': metadata},
+                                s3_bucket=args.bucket,
+                                s3_key='metadata.json',
+                                prefix='transcript',
+                                partitions=partitions)
+            # providers that can stream the transcript have it piped to S3 as it is downloaded
+            elif hasattr(transcriber, 'retrieve_transcript_stream') and \
+                    config[args.service].get('stream_transcript', True):
+                chunks = transcriber.retrieve_transcript_stream(identifier=args.identifier,
+                                                                language=args.language,
+                                                                speaker_type=args.speaker_type,
+                                                                service_config=config[args.service])
+                try:
+                    # the first chunk arrives when the job has finished
+                    first_chunk = next(chunks, b'')
+                    metadata['finished_at'] = str(datetime.datetime.utcnow())
+                    logging.info(f'Succesfully retrieved transcript on {args.service}')
+                    logging.info(f'Stream transcript to S3')
+                    save_transcript_stream(chunks=chain([first_chunk], chunks),
+                                           metadata=metadata,
+                                           s3_bucket=args.bucket,
+                                           partitions=partitions)
+                finally:
+                    chunks.close()
+            else:
+                transcript = transcriber.retrieve_transcript(identifier=args.identifier,
+                                                             language=args.language,
+                                                             speaker_type=args.speaker_type,
+                                                             service_config=config[args.service])
+                metadata['finished_at'] = str(datetime.datetime.utcnow())
+                transcript['metadata_internet_scholar'] = metadata
+
+                logging.info(f'Succesfully retrieved transcript on {args.service}')
+                logging.info(f'Save transcript on S3')
+                save_data_in_s3(content=transcript,
+                                s3_bucket=args.bucket,
+                                s3_key='transcript.json',
+                                prefix='transcript',
+                                partitions=partitions)
         finally:
-            delete_uploaded_file(args.identifier, config[args.service])
+            transcriber.delete_uploaded_file(args.identifier, config[args.service])
     finally:
         logger.save_to_s3()
 
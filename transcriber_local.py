@@ -1,47 +1,77 @@
 from pydub import AudioSegment
-from pydub.utils import make_chunks
 from pathlib import Path
 import shutil
-import json
-import uuid
 from internet_scholar import read_dict_from_s3, s3_prefix_exists, delete_s3_objects_by_prefix, save_data_in_s3, instantiate_ec2, AthenaDatabase, move_data_in_s3
 from collections import OrderedDict
-from transcriber_parser import parse_words
+from itertools import groupby
+from transcriber_parser import parse_words, stitch_transcript
+from transcriber_audio import SectionExporter, make_sections, normalize_timeframe, timeframe_to_ms
+from transcriber_sheets import SheetsBatch, GoogleClientPool, DriveCache, DRIVE_REQUESTS_PER_MINUTE, \
+    SHEETS_REQUESTS_PER_MINUTE, DRIVE_CACHE_TTL
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import os
-from googleapiclient.discovery import build
-from google.oauth2 import service_account
+import hashlib
+from google_credentials import get_credentials
 
-SELECT_TRANSCRIPT = """with updated_word as
+# length of a section in milliseconds; see transcriber_audio.normalize_timeframe for the format of timeframe
+TIMEFRAME_IN_MS = """case
+           when timeframe like '%s' then cast(substr(timeframe, 1, length(timeframe)-1) as bigint)*1000
+           when timeframe like '%m' then cast(substr(timeframe, 1, length(timeframe)-1) as bigint)*60*1000
+           else cast(timeframe as bigint)*60*60*1000
+       end"""
+
+SELECT_TRANSCRIPT_BATCH = """with updated_word as
 (select
-       ( start_time + ( (section-1)*timeframe*60*60*1000 ) ) / ({interval_in_seconds} * 1000) as time_slot,
+       speaker,
+       performance_date,
+       part,
+       ( start_time + ( (section-1)*""" + TIMEFRAME_IN_MS + """ ) ) / ({interval_in_seconds} * 1000) as time_slot,
        if(protagonist='1', word, upper(word)) as word,
        start_time,
        end_time,
        service
 from transcriptions.word
-where
-      project = '{project}' and
-      speaker = '{speaker}' and
-      performance_date = '{performance_date}' and 
-      part = {part}
-order by section, start_time, seq_num)
+{where_clause}
+      and word <> ''
+order by speaker, performance_date, part, section, start_time, seq_num)
 select
+    speaker,
+    performance_date,
+    part,
     time '00:00:00' + time_slot * {interval_in_seconds} * interval '1' second as time_slot,
+    time_slot as slot,
     array_join(array_remove(array_agg(if(service='microsoft', word, '')), ''), ' ') as microsoft,
     array_join(array_remove(array_agg(if(service='google', word, '')), ''), ' ') as google,
     array_join(array_remove(array_agg(if(service='aws', word, '')), ''), ' ') as aws,
     array_join(array_remove(array_agg(if(service='ibm', word, '')), ''), ' ') as ibm,
     '' as comments
 from updated_word
-group by time_slot
-order by time_slot"""
+group by speaker, performance_date, part, time_slot
+order by speaker, performance_date, part, time_slot"""
+
+TRANSCRIPT_COLUMNS = ['time_slot', 'microsoft', 'google', 'aws', 'ibm', 'comments']
+# columns A-E are generated; the comments column is typed by reviewers and is never overwritten
+GENERATED_COLUMNS = len(TRANSCRIPT_COLUMNS) - 1
+
+SELECT_PART_FINGERPRINTS = """select speaker, performance_date, part, service, protagonist, timeframe, section,
+       count(*) as words,
+       to_hex(checksum(concat(word, '|', cast(start_time as varchar), '|', cast(end_time as varchar)))) as checksum
+from word
+{where_clause}
+      and word <> ''
+group by speaker, performance_date, part, service, protagonist, timeframe, section
+order by speaker, performance_date, part, service, protagonist, timeframe, section"""
 
-SELECT_ALL_PARTS = """select distinct performance_date, part
-from word {where_clause} order by performance_date, part"""
+TRANSCRIPT_HASH_KEY = 'transcript_hash'
+# hash of a sheet that is being written: it is recorded with the new sheet (or before a sheet without a hash is
+# rewritten) and replaced by the actual hash once the sheet is complete, so a half-written sheet is never adopted
+TRANSCRIPT_HASH_PENDING = 'pending'
 
-SELECT_ALL_SPEAKERS = """select distinct speaker
-from word {where_clause} order by speaker"""
+# written in place of the words of a section that has none left after stitching, so that the section counts as
+# parsed (see SELECT_NON_PARSED_TRANSCRIPTS); real words are never empty and seq_num starts at 1. SELECT_TRANSCRIPT_BATCH
+# and SELECT_PART_FINGERPRINTS skip it: a part with nothing but markers has no sheet.
+EMPTY_SECTION_MARKER = [{'seq_num': 0, 'word': '', 'start_time': 0, 'end_time': 0}]
 
 SELECT_ALL_PROJECTS = """select distinct project
 from word {where_clause} order by project"""
@@ -62,6 +92,21 @@ from metadata
                 word.section = metadata.section)
 order by project, speaker, service, speaker_type"""
 
+SELECT_SECTIONS_OF_NON_PARSED_TRANSCRIPTS = """with non_parsed as (
+{non_parsed_transcripts})
+select distinct metadata.project, metadata.speaker, metadata.performance_date, metadata.part, metadata.speaker_type,
+       metadata.timeframe, metadata.section, metadata.service
+from metadata, non_parsed
+where metadata.project = non_parsed.project and
+      metadata.speaker = non_parsed.speaker and
+      metadata.performance_date = non_parsed.performance_date and
+      metadata.part = non_parsed.part and
+      metadata.speaker_type = non_parsed.speaker_type and
+      metadata.timeframe = non_parsed.timeframe and
+      metadata.service = non_parsed.service
+order by metadata.project, metadata.speaker, metadata.performance_date, metadata.part, metadata.service,
+         metadata.speaker_type, metadata.timeframe, metadata.section"""
+
 SELECT_JOBS = """with job as (
     select *
     from (values {jobs_values}) 
@@ -85,6 +130,11 @@ where not exists (
     )"""
 
 
+def time_slot_label(seconds):
+    # same format as the time_slot column of SELECT_TRANSCRIPT_BATCH
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}.000"
+
+
 class Transcript:
     def __init__(self, bucket):
         self.instance_type = 't3a.nano'
@@ -104,14 +154,6 @@ class Transcript:
             from transcribe_aws import upload_audio_file, delete_uploaded_file
         elif service == "ibm":
             from transcribe_ibm import upload_audio_file, delete_uploaded_file
-            size = 10
-            if Path(filepath).stat().st_size >= 1073741824:
-                extension = Path(filepath).suffix[1:]
-                sound = AudioSegment.from_file(filepath, extension)
-                sound = sound.set_channels(1)
-                Path('./audio/').mkdir(parents=True, exist_ok=True)
-                filepath = f"./audio/{uuid.uuid4()}.mp3"
-                sound.export(filepath, format="mp3")
         else:
             raise Exception(f"Invalid service: {service}")
 
@@ -134,27 +176,32 @@ class Transcript:
 
     def retrieve_transcript(self, project, speaker, performance_date, part=1, timeframe=3, language=None,
                             both=None, single=None, interviewee=None, interviewer=None,
-                            microsoft=False, ibm=False, aws=False, google=False):
+                            microsoft=False, ibm=False, aws=False, google=False, silence_window=30,
+                            overlap=0):
         if single is not None:
             self.inner_retrieve_transcript(project=project, speaker=speaker, performance_date=performance_date,
                                            speaker_type='single', part=part, timeframe=timeframe,
                                            language=language, filepath=single,
-                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google)
+                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google,
+                                           silence_window=silence_window, overlap=overlap)
         if both is not None:
             self.inner_retrieve_transcript(project=project, speaker=speaker, performance_date=performance_date,
                                            speaker_type='both', part=part, timeframe=timeframe,
                                            language=language, filepath=both,
-                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google)
+                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google,
+                                           silence_window=silence_window, overlap=overlap)
         if interviewee is not None:
             self.inner_retrieve_transcript(project=project, speaker=speaker, performance_date=performance_date,
                                            speaker_type='interviewee', part=part, timeframe=timeframe,
                                            language=language, filepath=interviewee,
-                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google)
+                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google,
+                                           silence_window=silence_window, overlap=overlap)
         if interviewer is not None:
             self.inner_retrieve_transcript(project=project, speaker=speaker, performance_date=performance_date,
                                            speaker_type='interviewer', part=part, timeframe=timeframe,
                                            language=language, filepath=interviewer,
-                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google)
+                                           microsoft=microsoft, ibm=ibm, aws=aws, google=google,
+                                           silence_window=silence_window, overlap=overlap)
 
     def delete_different_timeframe(self, service, project, speaker, performance_date, speaker_type, part, timeframe):
         prefix = f"transcript/service={service}/project={project}/speaker={speaker}/" \
@@ -173,8 +220,9 @@ class Transcript:
 
     def inner_retrieve_transcript(self, project, speaker, performance_date,
                                   speaker_type, part, timeframe, language, filepath,
-                                  microsoft, ibm, aws, google):
+                                  microsoft, ibm, aws, google, silence_window=30, overlap=0):
         athena_db = AthenaDatabase(database=self.config['aws']['athena'], s3_output=self.bucket)
+        timeframe = normalize_timeframe(timeframe)
 
         # delete existing sections
         if microsoft:
@@ -196,14 +244,16 @@ class Transcript:
         if self.repair_metadata:
             self.repair_table_metadata()
 
-        # create audio object and slice it according to timeframe (in hours)
+        # create audio object and slice it according to timeframe (hours, minutes or seconds)
         extension = Path(filepath).suffix[1:]
         sound = AudioSegment.from_file(filepath, extension)
         sound = sound.set_channels(1)
-        if (timeframe * 60 * 60) > 13200.0:  # more than 3 hours and 40 minutes
+        chunk_length_ms = timeframe_to_ms(timeframe)  # pydub calculates in millisec
+        if (chunk_length_ms / 1000) + silence_window + overlap > 13200.0:  # more than 3 hours and 40 minutes
             self.instance_type = 't3a.micro'
-        chunk_length_ms = timeframe * 60 * 60 * 1000  # pydub calculates in millisec
-        chunks = make_chunks(sound, chunk_length_ms)  # Make chunks of ten seconds
+        # cut at the quietest point within silence_window seconds after each multiple of timeframe; with overlap,
+        # each section also carries the first `overlap` seconds of the next one (stitched back in parse_words)
+        chunks = make_sections(sound, chunk_length_ms, silence_window * 1000, overlap * 1000)
 
         # determine list of jobs that need to be performed
         jobs = list()
@@ -264,7 +314,7 @@ class Transcript:
         for i in range(len(jobs)):
             jobs_values = f"('{jobs[i]['service']}','{jobs[i]['project']}','{jobs[i]['speaker']}'," \
                           f"'{jobs[i]['performance_date']}',{jobs[i]['part']},'{jobs[i]['speaker_type']}'," \
-                          f"{jobs[i]['timeframe']},{jobs[i]['section']}),{jobs_values}"
+                          f"'{jobs[i]['timeframe']}',{jobs[i]['section']}),{jobs_values}"
         jobs_values = jobs_values[:-1] # eliminate the final comma
         jobs_athena = athena_db.query_athena_and_download(query_string=SELECT_JOBS.format(jobs_values=jobs_values),
                                                           filename='jobs.csv')
@@ -285,17 +335,9 @@ class Transcript:
 
         # export audio e instantiate cloud transcribers
         if len(jobs) > 0:
-            created_audio = False
-            Path('./audio/').mkdir(parents=True, exist_ok=True)
-            destination = list()
+            # each section is encoded in the cheapest format that the provider of the job accepts
+            section_exporter = SectionExporter(sections=chunks)
             try:
-                # export audio
-                for i, chunk in enumerate(chunks):
-                    temp_sound_file = f"./audio/{uuid.uuid4()}.wav"
-                    chunk.export(temp_sound_file, format="wav", parameters=['-acodec', 'pcm_s16le'])
-                    created_audio = True
-                    destination.append(temp_sound_file)
-                # instantiate cloud transcribers
                 for job in jobs:
                     self.instantiate_cloud_transcriber(service=job['service'],
                                                        project=job['project'],
@@ -306,10 +348,11 @@ class Transcript:
                                                        language=language,
                                                        speaker=job['speaker'],
                                                        speaker_type=job['speaker_type'],
-                                                       filepath=destination[int(job['section'])-1]) # destination is zero-based
+                                                       filepath=section_exporter.export(service=job['service'],
+                                                                                        section=int(job['section'])))
             finally:
-                if created_audio:
-                    shutil.rmtree("./audio")
+                if Path(section_exporter.folder).exists():
+                    shutil.rmtree(section_exporter.folder)
 
     def get_where_clause(self, project=None, speaker=None, performance_date=None, part=None):
         where_clause = ""
@@ -384,249 +427,460 @@ class Transcript:
         else:
             select = SELECT_NON_PARSED_TRANSCRIPTS.format(where_clause=where_clause)
         athena_db = AthenaDatabase(database=self.config['aws']['athena'], s3_output=self.bucket)
-        unparsed_records = athena_db.query_athena_and_download(query_string=select,
-                                                               filename='unparsed_records.csv')
+        # every section of each transcript that has at least one unparsed section: adjacent sections are stitched
+        # together, so they have to be parsed together
+        unparsed_records = athena_db.query_athena_and_download(
+            query_string=SELECT_SECTIONS_OF_NON_PARSED_TRANSCRIPTS.format(non_parsed_transcripts=select),
+            filename='unparsed_records.csv')
         with open(unparsed_records) as unparsed_file:
             reader = csv.DictReader(unparsed_file)
             database_has_changed = False
             try:
                 print("Parse words...")
-                for row in reader:
-                    print(f"{row['speaker']}_{row['performance_date']}_{row['part']}_{row['service']}_{row['speaker_type']}_{row['section']}")
-                    transcript = read_dict_from_s3(self.bucket,
-                                                   f"transcript/service={row['service']}/project={row['project']}/speaker={row['speaker']}/"
-                                                   f"performance_date={row['performance_date']}/part={row['part']}/"
-                                                   f"speaker_type={row['speaker_type']}/timeframe={row['timeframe']}/"
-                                                   f"section={row['section']}/transcript.json.bz2",
-                                                   compressed=True)
-                    protagonist_words, non_protagonist_words = parse_words(transcript=transcript,
-                                                                           speaker_type=row['speaker_type'],
-                                                                           service=row['service'])
-                    partitions = OrderedDict()
-                    partitions['project'] = row['project']
-                    partitions['speaker'] = row['speaker']
-                    partitions['performance_date'] = row['performance_date']
-                    partitions['part'] = row['part']
-                    partitions['service'] = row['service']
-                    partitions['protagonist'] = -1
-                    partitions['timeframe'] = row['timeframe']
-                    partitions['section'] = row['section']
-                    if len(protagonist_words) > 0:
-                        partitions['protagonist'] = 1
-                        save_data_in_s3(content=protagonist_words,
-                                        s3_bucket=self.bucket,
-                                        s3_key='word.json',
-                                        prefix='word',
-                                        partitions=partitions)
-                    if len(non_protagonist_words) > 0:
-                        partitions['protagonist'] = 0
-                        save_data_in_s3(content=non_protagonist_words,
-                                        s3_bucket=self.bucket,
-                                        s3_key='word.json',
-                                        prefix='word',
-                                        partitions=partitions)
-                        database_has_changed = True
+                for group, rows in groupby(reader, key=lambda row: (row['project'], row['speaker'],
+                                                                    row['performance_date'], row['part'],
+                                                                    row['service'], row['speaker_type'],
+                                                                    row['timeframe'])):
+                    protagonist_sections = dict()
+                    non_protagonist_sections = dict()
+                    for row in rows:
+                        print(f"{row['speaker']}_{row['performance_date']}_{row['part']}_{row['service']}_{row['speaker_type']}_{row['section']}")
+                        transcript_prefix = f"transcript/service={row['service']}/project={row['project']}/speaker={row['speaker']}/" \
+                                            f"performance_date={row['performance_date']}/part={row['part']}/" \
+                                            f"speaker_type={row['speaker_type']}/timeframe={row['timeframe']}/" \
+                                            f"section={row['section']}/"
+                        # transcripts that the provider wrote to S3 itself are not compressed
+                        if s3_prefix_exists(bucket=self.bucket, prefix=f"{transcript_prefix}transcript.json.bz2"):
+                            transcript = read_dict_from_s3(self.bucket, f"{transcript_prefix}transcript.json.bz2",
+                                                           compressed=True)
+                        else:
+                            transcript = read_dict_from_s3(self.bucket, f"{transcript_prefix}transcript.json")
+                        protagonist_words, non_protagonist_words = parse_words(transcript=transcript,
+                                                                               speaker_type=row['speaker_type'],
+                                                                               service=row['service'])
+                        protagonist_sections[int(row['section'])] = protagonist_words
+                        non_protagonist_sections[int(row['section'])] = non_protagonist_words
+                    project_name, speaker_name, performance_date_name, part_name, service, speaker_type, timeframe = group
+                    section_length = timeframe_to_ms(timeframe)
+                    # the side that SELECT_NON_PARSED_TRANSCRIPTS looks at to tell whether a section was parsed
+                    parsed_protagonist = 0 if speaker_type == 'interviewer' else 1
+                    stitched = stitch_transcript(protagonist_sections=protagonist_sections,
+                                                 non_protagonist_sections=non_protagonist_sections,
+                                                 speaker_type=speaker_type, section_length=section_length)
+                    for protagonist, sections in stitched.items():
+                        for section, words in sections.items():
+                            partitions = OrderedDict()
+                            partitions['project'] = project_name
+                            partitions['speaker'] = speaker_name
+                            partitions['performance_date'] = performance_date_name
+                            partitions['part'] = part_name
+                            partitions['service'] = service
+                            partitions['protagonist'] = protagonist
+                            partitions['timeframe'] = timeframe
+                            partitions['section'] = section
+                            if len(words) == 0:
+                                # stitching may have moved every word of the section to its neighbours: the words
+                                # saved by an earlier parse would otherwise be counted twice
+                                prefix_word = "word/" + "/".join(f"{key}={value}" for key, value in partitions.items())
+                                delete_s3_objects_by_prefix(bucket=self.bucket, prefix=f"{prefix_word}/")
+                                database_has_changed = True
+                                if protagonist != parsed_protagonist:
+                                    continue
+                                words = EMPTY_SECTION_MARKER
+                            save_data_in_s3(content=words,
+                                            s3_bucket=self.bucket,
+                                            s3_key='word.json',
+                                            prefix='word',
+                                            partitions=partitions)
+                            database_has_changed = True
             finally:
                 if database_has_changed:
                     self.repair_table_word()
 
-    def export_google_sheets(self, project=None, speaker=None, interval_in_seconds=10):
+    def export_transcript_batch(self, athena_db, project, parts, interval_in_seconds):
+        # one Athena query for every requested (speaker, performance_date, part), split client-side into one CSV per part
+        conditions = " or ".join(f"(speaker = '{speaker}' and performance_date = '{performance_date}' and part = {part})"
+                                 for speaker, performance_date, part in parts)
+        batch_file = athena_db.query_athena_and_download(
+            SELECT_TRANSCRIPT_BATCH.format(where_clause=f"where project = '{project}' and ({conditions})",
+                                           interval_in_seconds=interval_in_seconds),
+            f"{project}_{interval_in_seconds}.csv")
+        # SELECT_TRANSCRIPT_BATCH only returns the time slots that have words: the ones in between are written as
+        # empty rows, so that the row of a time slot never moves and the comments typed next to it stay there when
+        # words are added to a slot that was empty
+        transcript_files = OrderedDict()
+        csv_file = None
+        next_slot = 0
+        try:
+            with open(batch_file, 'r', encoding="utf-8", newline='') as batch_csv:
+                batch_reader = csv.DictReader(batch_csv)
+                current_key = None
+                for row in batch_reader:
+                    key = (row['speaker'], row['performance_date'], row['part'])
+                    if key != current_key:
+                        if csv_file is not None:
+                            csv_file.close()
+                        filename = f"./csv/{project}_{row['speaker']}_" \
+                                   f"{row['performance_date']}_{row['part']}_{interval_in_seconds}.csv"
+                        print(filename)
+                        csv_file = open(filename, 'w', encoding="utf-8", newline='')
+                        writer = csv.DictWriter(csv_file, fieldnames=TRANSCRIPT_COLUMNS,
+                                                extrasaction='ignore', quoting=csv.QUOTE_ALL)
+                        writer.writeheader()
+                        if row['speaker'] not in transcript_files:
+                            transcript_files[row['speaker']] = OrderedDict()
+                        transcript_files[row['speaker']][(row['performance_date'], row['part'])] = filename
+                        current_key = key
+                        next_slot = 0
+                    slot = int(row['slot'])
+                    for empty_slot in range(next_slot, slot):
+                        writer.writerow({'time_slot': time_slot_label(empty_slot * interval_in_seconds)})
+                    writer.writerow(row)
+                    next_slot = slot + 1
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+            os.remove(batch_file)
+        return transcript_files
+
+    def get_part_hashes(self, athena_db, project, speaker, interval_in_seconds):
+        # content hash per (speaker, performance_date, part, interval) computed from the word partitions behind it
+        fingerprints = athena_db.query_athena_and_download(
+            query_string=SELECT_PART_FINGERPRINTS.format(where_clause=self.get_where_clause(project=project, speaker=speaker)),
+            filename='selected_part_fingerprints.csv')
+        part_hashes = OrderedDict()
+        with open(fingerprints) as fingerprints_csv:
+            fingerprints_reader = csv.DictReader(fingerprints_csv)
+            for row in fingerprints_reader:
+                if row['speaker'] not in part_hashes:
+                    part_hashes[row['speaker']] = OrderedDict()
+                key = (row['performance_date'], row['part'])
+                if key not in part_hashes[row['speaker']]:
+                    part_hashes[row['speaker']][key] = hashlib.sha1(f"{interval_in_seconds}".encode('utf-8'))
+                part_hashes[row['speaker']][key].update(
+                    f"|{row['service']},{row['protagonist']},{row['timeframe']},{row['section']},"
+                    f"{row['words']},{row['checksum']}".encode('utf-8'))
+        for speaker_hashes in part_hashes.values():
+            for key in speaker_hashes:
+                speaker_hashes[key] = speaker_hashes[key].hexdigest()
+        return part_hashes
+
+    def get_project_folder(self, clients, drive_cache, project):
+        folder_ids = drive_cache.lookup(folder_id=self.config['google']['transcription_folder'],
+                                        name=project,
+                                        mime_type='application/vnd.google-apps.folder')
+        if len(folder_ids) == 0:
+            folder_metadata = {
+                'name': project,
+                'mimeType': 'application/vnd.google-apps.folder',
+                'parents': [self.config['google']['transcription_folder'], ]
+            }
+            project_folder = clients.execute_drive(clients.drive().files().create(body=folder_metadata,
+                                                                                  fields='id'))
+            drive_cache.add(folder_id=self.config['google']['transcription_folder'],
+                            name=project,
+                            mime_type='application/vnd.google-apps.folder',
+                            file_id=project_folder['id'])
+            return project_folder['id']
+        elif len(folder_ids) == 1:
+            return folder_ids[0]
+        else:
+            raise Exception("Error! Should not have more than 1 folder for this project!")
+
+    def get_speaker_spreadsheet(self, clients, drive_cache, project_id, speaker):
+        spreadsheet_ids = drive_cache.lookup(folder_id=project_id,
+                                             name=speaker,
+                                             mime_type='application/vnd.google-apps.spreadsheet')
+        if len(spreadsheet_ids) == 1:
+            return spreadsheet_ids[0], False
+        elif len(spreadsheet_ids) >= 2:
+            raise Exception("Error! Should not have more than 1 spreadsheet for this project!")
+        else:  # it is 0
+            body = {
+                'mimeType': 'application/vnd.google-apps.spreadsheet',
+                'name': speaker,
+                'parents': [project_id, ]
+            }
+            response = clients.execute_drive(clients.drive().files().create(body=body, fields='id'))
+            drive_cache.add(folder_id=project_id,
+                            name=speaker,
+                            mime_type='application/vnd.google-apps.spreadsheet',
+                            file_id=response['id'])
+            return response['id'], True
+
+    def get_sheets(self, clients, spreadsheet_id):
+        response = clients.execute_sheets(clients.sheets().spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets(properties(sheetId,title,gridProperties(rowCount,columnCount)),'
+                   'developerMetadata(metadataId,metadataKey,metadataValue))'))
+        sheets = dict()
+        for sheet in response.get('sheets', []):
+            grid = sheet['properties'].get('gridProperties', {})
+            sheets[sheet['properties']['title']] = {
+                'sheet_id': sheet['properties']['sheetId'],
+                'row_count': grid.get('rowCount', 0),
+                'column_count': grid.get('columnCount', 0),
+                'metadata_id': None,
+                'hash': None
+            }
+            for metadata in sheet.get('developerMetadata', []):
+                if metadata['metadataKey'] == TRANSCRIPT_HASH_KEY:
+                    sheets[sheet['properties']['title']]['metadata_id'] = metadata['metadataId']
+                    sheets[sheet['properties']['title']]['hash'] = metadata['metadataValue']
+        return sheets
+
+    def get_changed_parts(self, clients, drive_cache, project_id, speaker, speaker_hashes, overwrite=False):
+        # compare the hashes stored in the spreadsheet with the current ones. Sheets without a hash were written
+        # before exports were incremental: they are only rewritten if `overwrite` is set, otherwise their current
+        # hash is recorded (adopted) so that later changes of the words update them. Sheets whose hash is still
+        # TRANSCRIPT_HASH_PENDING were not completely written by an earlier export, and are rewritten.
+        spreadsheet_id, created = self.get_speaker_spreadsheet(clients=clients, drive_cache=drive_cache,
+                                                               project_id=project_id, speaker=speaker)
+        if created:
+            sheets = dict()
+        else:
+            sheets = self.get_sheets(clients=clients, spreadsheet_id=spreadsheet_id)
+        changed = list()
+        adopted = list()
+        for (performance_date, part), part_hash in speaker_hashes.items():
+            sheet = sheets.get(f"{performance_date} / {part}")
+            if sheet is not None and sheet['hash'] is None and not overwrite:
+                print(f"Sheet {performance_date} / {part} for {speaker} already exists. I will not overwrite.")
+                adopted.append((performance_date, part))
+            elif sheet is None or sheet['hash'] != part_hash:
+                changed.append((performance_date, part))
+        if len(changed) == 0 and len(adopted) == 0:
+            print(f"Spreadsheet for {speaker} is up to date.")
+            return None
+        return speaker, spreadsheet_id, created, sheets, changed, adopted
+
+    def write_speaker_spreadsheet(self, clients, speaker, spreadsheet_id, created, sheets, changed, adopted,
+                                  transcript_files, speaker_hashes):
+        # sheet ids are assigned here so that all requests of a speaker fit in one batch
+        if created:
+            next_sheet_id = 0
+        else:
+            next_sheet_id = max([sheet['sheet_id'] for sheet in sheets.values()], default=-1) + 1
+        with SheetsBatch(google_sheets=clients.sheets(), spreadsheet_id=spreadsheet_id,
+                         rate_limiter=clients.sheets_limiter) as batch:
+            for performance_date, part in changed:
+                title = f"{performance_date} / {part}"
+                sheet = sheets.get(title)
+                if sheet is None:
+                    sheet_id = next_sheet_id
+                    next_sheet_id = next_sheet_id + 1
+                else:
+                    sheet_id = sheet['sheet_id']
+                self.add_sheet_requests(batch=batch,
+                                        title=title,
+                                        sheet_id=sheet_id,
+                                        sheet=sheet,
+                                        rename=(created and sheet_id == 0),
+                                        filename=transcript_files[speaker][(performance_date, part)],
+                                        part_hash=speaker_hashes[(performance_date, part)])
+            for performance_date, part in adopted:
+                batch.add(self.create_hash_request(sheet_id=sheets[f"{performance_date} / {part}"]['sheet_id'],
+                                                   part_hash=speaker_hashes[(performance_date, part)]))
+        print(f"Spreadsheet for {speaker}: {len(changed)} sheet(s) written and {len(adopted)} adopted "
+              f"in {batch.calls} call(s).")
+
+    def create_hash_request(self, sheet_id, part_hash):
+        return {
+            "createDeveloperMetadata": {
+                "developerMetadata": {
+                    "metadataKey": TRANSCRIPT_HASH_KEY,
+                    "metadataValue": part_hash,
+                    "location": {"sheetId": sheet_id},
+                    "visibility": "DOCUMENT"
+                }
+            }
+        }
+
+    def update_hash_request(self, sheet_id, part_hash, metadata_id=None):
+        if metadata_id is None:
+            lookup = {"metadataKey": TRANSCRIPT_HASH_KEY, "metadataLocation": {"sheetId": sheet_id}}
+        else:
+            lookup = {"metadataId": metadata_id}
+        return {
+            "updateDeveloperMetadata": {
+                "dataFilters": [{"developerMetadataLookup": lookup}],
+                "developerMetadata": {"metadataValue": part_hash},
+                "fields": "metadataValue"
+            }
+        }
+
+    def add_sheet_requests(self, batch, title, sheet_id, sheet, rename, filename, part_hash):
+        pending_request = self.create_hash_request(sheet_id=sheet_id, part_hash=TRANSCRIPT_HASH_PENDING)
+        if sheet is None:
+            if rename:
+                # a new spreadsheet comes with one empty sheet: rename it instead of adding another one
+                batch.add_together({
+                    "updateSheetProperties": {
+                        "fields": "title,gridProperties.rowCount,gridProperties.columnCount,gridProperties.frozenRowCount",
+                        "properties": {"sheetId": sheet_id,
+                                       "title": title,
+                                       "gridProperties": {
+                                           "rowCount": 3,
+                                           "columnCount": 3,
+                                           "frozenRowCount": 1
+                                       },
+                                       "index": 0}
+                    }
+                }, pending_request)
+            else:
+                batch.add_together({
+                    "addSheet": {
+                        "properties": {
+                            "sheetId": sheet_id,
+                            "title": title,
+                            "gridProperties": {
+                                "rowCount": 3,
+                                "columnCount": 3,
+                                "frozenRowCount": 1
+                            }
+                        }
+                    }
+                }, pending_request)
+            hash_request = self.update_hash_request(sheet_id=sheet_id, part_hash=part_hash)
+            batch.paste_csv(sheet_id=sheet_id, filename=filename)
+        else:
+            if sheet['metadata_id'] is None:
+                batch.add(pending_request)
+            # clear the old content of the generated columns, the new transcript might have fewer rows. The
+            # comments column and the size of the grid are kept, so comments stay where they were typed.
+            batch.add({
+                "updateCells": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": GENERATED_COLUMNS
+                    },
+                    "fields": "userEnteredValue"
+                }
+            })
+            batch.paste_csv(sheet_id=sheet_id, filename=filename, columns=GENERATED_COLUMNS,
+                            min_rows=sheet['row_count'], min_columns=sheet['column_count'])
+            hash_request = self.update_hash_request(sheet_id=sheet_id, part_hash=part_hash,
+                                                    metadata_id=sheet['metadata_id'])
+        batch.add({
+            "repeatCell": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "startRowIndex": 0,
+                    "startColumnIndex": 0
+                },
+                "cell":
+                    {
+                        "userEnteredFormat": {
+                            "verticalAlignment": "TOP",
+                            "wrapStrategy": "WRAP"
+                        },
+                    },
+                "fields": "userEnteredFormat.wrapStrategy,userEnteredFormat.verticalAlignment"
+            }
+        })
+        batch.add({
+            "updateDimensionProperties": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "startIndex": 0,
+                    "endIndex": 1
+                },
+                "properties": {
+                    "pixelSize": 60
+                },
+                "fields": "pixelSize"
+            }
+        })
+        batch.add({
+            "updateDimensionProperties": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "startIndex": 1
+                },
+                "properties": {
+                    "pixelSize": 280
+                },
+                "fields": "pixelSize"
+            }
+        })
+        # the hash goes last: if a flush fails midway, the sheet keeps TRANSCRIPT_HASH_PENDING (or its old hash) and
+        # is rewritten on the next run
+        batch.add(hash_request)
+
+    def export_google_sheets(self, project=None, speaker=None, interval_in_seconds=10, max_workers=8,
+                             drive_cache_file=None, drive_cache_ttl=DRIVE_CACHE_TTL, overwrite=False):
+        # incremental export: each sheet stores the hash of the words behind it, so only new or changed parts are
+        # queried on Athena and written to Google Sheets. Spreadsheets of different speakers are independent, so
+        # they are checked and written by a pool of `max_workers` threads that share the API rate limits.
+        # Drive lookups go through a DriveCache, optionally persisted in `drive_cache_file` for `drive_cache_ttl` s.
+        # Sheets written by older versions (without a hash) are only rewritten if `overwrite` is set.
         self.parse_words(project=project, speaker=speaker)
 
         Path("./csv/").mkdir(parents=True, exist_ok=True)
         print("Export CSVs...")
         try:
-            json_string = json.dumps(self.config['google'])
-            Path('./local_credentials/').mkdir(parents=True, exist_ok=True)
-            temp_file = f"./local_credentials/{uuid.uuid4()}.json"
-            with open(temp_file, 'w', encoding="utf-8") as json_file:
-                json_file.write(json_string)
-            try:
-                credentials_google_drive = service_account.Credentials.from_service_account_file(
-                    temp_file,
-                    scopes=['https://www.googleapis.com/auth/drive'])
-                credentials_google_sheets = service_account.Credentials.from_service_account_file(
-                    temp_file,
-                    scopes=['https://www.googleapis.com/auth/spreadsheets'])
-            finally:
-                shutil.rmtree('./local_credentials')
-            google_drive = build('drive', 'v3', credentials=credentials_google_drive)
-            google_sheets = build('sheets', 'v4', credentials=credentials_google_sheets)
+            credentials_google_drive = get_credentials(self.config['google'],
+                                                       scopes=['https://www.googleapis.com/auth/drive'])
+            credentials_google_sheets = get_credentials(self.config['google'],
+                                                        scopes=['https://www.googleapis.com/auth/spreadsheets'])
+            clients = GoogleClientPool(
+                credentials_drive=credentials_google_drive,
+                credentials_sheets=credentials_google_sheets,
+                drive_per_minute=self.config['google'].get('drive_requests_per_minute', DRIVE_REQUESTS_PER_MINUTE),
+                sheets_per_minute=self.config['google'].get('sheets_requests_per_minute', SHEETS_REQUESTS_PER_MINUTE))
+            drive_cache = DriveCache(clients=clients, cache_file=drive_cache_file, ttl=drive_cache_ttl)
 
             athena_db = AthenaDatabase(database=self.config['aws']['athena'], s3_output=self.bucket)
 
             all_projects = athena_db.query_athena_and_download(
                 query_string=SELECT_ALL_PROJECTS.format(where_clause=self.get_where_clause(project=project, speaker=speaker)),
                 filename='selected_all_projects.csv')
-            with open(all_projects) as all_projects_csv:
+            with open(all_projects) as all_projects_csv, ThreadPoolExecutor(max_workers=max_workers) as executor:
                 projects_reader = csv.DictReader(all_projects_csv)
                 for projects_row in projects_reader:
-                    response_project = google_drive.files().list(
-                        q=f"mimeType='application/vnd.google-apps.folder' and "
-                          f"'{self.config['google']['transcription_folder']}' in parents and "
-                          f"name='{projects_row['project']}'",
-                        spaces='drive',
-                        fields='files(id, name)').execute()
-                    if len(response_project['files']) == 0:
-                        folder_metadata = {
-                            'name': projects_row['project'],
-                            'mimeType': 'application/vnd.google-apps.folder',
-                            'parents': [self.config['google']['transcription_folder'], ]
-                        }
-                        project_folder = google_drive.files().create(body=folder_metadata,
-                                                                     fields='id').execute()
-                        project_id = project_folder['id']
-                    elif len(response_project['files']) == 1:
-                        project_id = response_project['files'][0]['id']
-                    else:
-                        raise Exception("Error! Should not have more than 1 folder for this project!")
-
-                    all_speakers = athena_db.query_athena_and_download(
-                        query_string=SELECT_ALL_SPEAKERS.format(where_clause=self.get_where_clause(project=projects_row['project'], speaker=speaker)),
-                        filename='selected_all_speakers.csv')
-                    with open(all_speakers) as all_speakers_csv:
-                        speakers_reader = csv.DictReader(all_speakers_csv)
-                        for speakers_row in speakers_reader:
-                            response_spreadsheet = google_drive.files().list(
-                                q=f"mimeType='application/vnd.google-apps.spreadsheet' and '{project_id}' in parents and name='{speakers_row['speaker']}'",
-                                spaces='drive',
-                                fields='files(id, name)').execute()
-                            if len(response_spreadsheet['files']) == 1:
-                                print(f"Spreadsheet for {speakers_row['speaker']} already exists. I will not overwrite.")
-                            elif len(response_spreadsheet['files']) >= 2:
-                                raise Exception("Error! Should not have more than 1 spreadsheet for this project!")
-                            else:  # it is 0
-                                body = {
-                                    'mimeType': 'application/vnd.google-apps.spreadsheet',
-                                    'name': speakers_row['speaker'],
-                                    'parents': [project_id, ]
-                                }
-                                response = google_drive.files().create(body=body, fields='id').execute()
-                                speaker_id = response['id']
-                                all_parts = athena_db.query_athena_and_download(
-                                    query_string=SELECT_ALL_PARTS.format(
-                                        where_clause=self.get_where_clause(project=projects_row['project'], speaker=speakers_row['speaker'])),
-                                    filename='selected_all_parts.csv')
-                                with open(all_parts) as all_parts_csv:
-                                    parts_reader = csv.DictReader(all_parts_csv)
-                                    first_sheet = True
-                                    for parts_row in parts_reader:
-                                        filename = f"{projects_row['project']}_{speakers_row['speaker']}_" \
-                                                   f"{parts_row['performance_date']}_{parts_row['part']}_{interval_in_seconds}.csv"
-                                        print(filename)
-                                        new_file = athena_db.query_athena_and_download(SELECT_TRANSCRIPT.format(project=projects_row['project'],
-                                                                                                                speaker=speakers_row['speaker'],
-                                                                                                                performance_date=parts_row[
-                                                                                                                    'performance_date'],
-                                                                                                                part=parts_row['part'],
-                                                                                                                interval_in_seconds=interval_in_seconds),
-                                                                                       filename)
-                                        os.replace(new_file, f'./csv/{filename}')
-                                        if first_sheet:
-                                            body = {
-                                                'requests': {
-                                                    "updateSheetProperties": {
-                                                        "fields": "title,gridProperties.rowCount,gridProperties.columnCount,gridProperties.frozenRowCount",
-                                                        "properties": {"title": f"{parts_row['performance_date']} / {parts_row['part']}",
-                                                                       "gridProperties": {
-                                                                           "rowCount": 3,
-                                                                           "columnCount": 3,
-                                                                           "frozenRowCount": 1
-                                                                       },
-                                                                       "index": 0}
-                                                    }
-                                                },
-                                                'includeSpreadsheetInResponse': True
-                                            }
-                                            response = google_sheets.spreadsheets().batchUpdate(spreadsheetId=speaker_id,
-                                                                                                body=body).execute()
-                                            sheet_id = response['updatedSpreadsheet']['sheets'][0]['properties']['sheetId']
-                                            first_sheet = False
-                                        else:
-                                            body = {
-                                                "requests": {
-                                                    "addSheet": {
-                                                        "properties": {
-                                                            "title": f"{parts_row['performance_date']} / {parts_row['part']}",
-                                                            "gridProperties": {
-                                                                "rowCount": 3,
-                                                                "columnCount": 3,
-                                                                "frozenRowCount": 1
-                                                            }
-                                                        }
-                                                    }
-                                                }
-                                            }
-                                            response = google_sheets.spreadsheets().batchUpdate(spreadsheetId=speaker_id,
-                                                                                                body=body).execute()
-                                            sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
-                                        with open(f'./csv/{filename}', 'r', encoding="utf-8") as csv_file:
-                                            csvContents = csv_file.read()
-                                        body = {
-                                            'requests': [{
-                                                'pasteData': {
-                                                    "coordinate": {
-                                                        "sheetId": sheet_id,
-                                                        "rowIndex": "0",  # adapt this if you need different positioning
-                                                        "columnIndex": "0",  # adapt this if you need different positioning
-                                                    },
-                                                    "data": csvContents,
-                                                    "type": 'PASTE_NORMAL',
-                                                    "delimiter": ',',
-                                                }
-                                            }]
-                                        }
-                                        response = google_sheets.spreadsheets().batchUpdate(spreadsheetId=speaker_id,
-                                                                                            body=body).execute()
-                                        body = {
-                                            "requests": [
-                                                {
-                                                    "repeatCell": {
-                                                        "range": {
-                                                            "sheetId": sheet_id,
-                                                            "startRowIndex": 0,
-                                                            "startColumnIndex": 0
-                                                        },
-                                                        "cell":
-                                                            {
-                                                                "userEnteredFormat": {
-                                                                    "verticalAlignment": "TOP",
-                                                                    "wrapStrategy": "WRAP"
-                                                                },
-                                                            },
-                                                        "fields": "userEnteredFormat.wrapStrategy,userEnteredFormat.verticalAlignment"
-                                                    }
-                                                },
-                                                {
-                                                    "updateDimensionProperties": {
-                                                        "range": {
-                                                            "sheetId": sheet_id,
-                                                            "dimension": "COLUMNS",
-                                                            "startIndex": 0,
-                                                            "endIndex": 1
-                                                        },
-                                                        "properties": {
-                                                            "pixelSize": 60
-                                                        },
-                                                        "fields": "pixelSize"
-                                                    }
-                                                },
-                                                {
-                                                    "updateDimensionProperties": {
-                                                        "range": {
-                                                            "sheetId": sheet_id,
-                                                            "dimension": "COLUMNS",
-                                                            "startIndex": 1
-                                                        },
-                                                        "properties": {
-                                                            "pixelSize": 280
-                                                        },
-                                                        "fields": "pixelSize"
-                                                    }
-                                                }
-                                            ]
-                                        }
-                                        response = google_sheets.spreadsheets().batchUpdate(spreadsheetId=speaker_id,
-                                                                                            body=body).execute()
+                    project_id = self.get_project_folder(clients=clients, drive_cache=drive_cache,
+                                                         project=projects_row['project'])
+                    part_hashes = self.get_part_hashes(athena_db=athena_db,
+                                                       project=projects_row['project'],
+                                                       speaker=speaker,
+                                                       interval_in_seconds=interval_in_seconds)
+
+                    futures = [executor.submit(self.get_changed_parts,
+                                               clients=clients,
+                                               drive_cache=drive_cache,
+                                               project_id=project_id,
+                                               speaker=speaker_name,
+                                               speaker_hashes=speaker_hashes,
+                                               overwrite=overwrite)
+                               for speaker_name, speaker_hashes in part_hashes.items()]
+                    pending = [future.result() for future in futures if future.result() is not None]
+
+                    if len(pending) > 0:
+                        changed_parts = [(speaker_name, performance_date, part)
+                                         for speaker_name, _, _, _, changed, _ in pending
+                                         for performance_date, part in changed]
+                        transcript_files = dict()
+                        if len(changed_parts) > 0:
+                            transcript_files = self.export_transcript_batch(athena_db=athena_db,
+                                                                            project=projects_row['project'],
+                                                                            parts=changed_parts,
+                                                                            interval_in_seconds=interval_in_seconds)
+                        futures = [executor.submit(self.write_speaker_spreadsheet,
+                                                   clients=clients,
+                                                   speaker=speaker_name,
+                                                   spreadsheet_id=spreadsheet_id,
+                                                   created=created,
+                                                   sheets=sheets,
+                                                   changed=changed,
+                                                   adopted=adopted,
+                                                   transcript_files=transcript_files,
+                                                   speaker_hashes=part_hashes[speaker_name])
+                                   for speaker_name, spreadsheet_id, created, sheets, changed, adopted in pending]
+                        for future in futures:
+                            future.result()
+            drive_cache.save()
         finally:
             shutil.rmtree('./csv')
@@ -1,3 +1,9 @@
+STITCH_TOLERANCE_MS = 500
+# protagonist sides that the words of each speaker type go to. Word partitions have the protagonist but not the speaker
+# type, so the transcripts of an interviewee and of an interviewer of the same part share them.
+PROTAGONIST_SIDES = {'interviewee': (1,), 'single': (1,), 'interviewer': (0,), 'both': (1, 0)}
+
+
 def split_words_protagonism(words):
     protagonist_words = []
     non_protagonist_words = []
@@ -159,4 +165,62 @@ def parse_words(transcript, speaker_type, service):
         words = parse_words_ibm(transcript=transcript, speaker_type=speaker_type)
     else:
         raise TypeError(f"Invalid service: {service}")
-    return split_words_protagonism(words)
\ No newline at end of file
+    return split_words_protagonism(words)
+
+
+def same_token(word, other_word):
+    return [c for c in word.casefold() if c.isalnum()] == [c for c in other_word.casefold() if c.isalnum()]
+
+
+def stitch_words(sections, section_length, tolerance=STITCH_TOLERANCE_MS):
+    """
+    Merges the words of consecutive sections of the same (part, service, protagonist) into one stream.
+
+    `sections` maps each section number to its words, with times relative to the start of the section, which is
+    (section - 1) * `section_length` ms into the part. Where two adjacent sections overlap, the words of the earlier
+    one are kept up to the middle of the overlap and those of the later one from there on. A word repeated at the
+    junction (same token, start within `tolerance` ms) is kept only once, which also covers words that straddle a cut.
+    Each word is looked at a constant number of times, so this runs in linear time.
+
+    Returns the same mapping, with the duplicates removed and `seq_num` numbering the words of all sections in a
+    single sequence. Times stay relative to their section.
+    """
+    stream = list()  # (section, word, absolute start, absolute end)
+    for section in sorted(sections):
+        offset = (section - 1) * section_length
+        words = [(section, word, word['start_time'] + offset, word['end_time'] + offset)
+                 for word in sections[section]]
+        if len(stream) > 0 and len(words) > 0:
+            if words[0][2] <= stream[-1][3]:
+                cut = (words[0][2] + stream[-1][3]) // 2
+                while len(stream) > 0 and stream[-1][2] >= cut:
+                    stream.pop()
+                words = [word for word in words if word[2] >= cut]
+            if len(stream) > 0 and len(words) > 0 and same_token(stream[-1][1]['word'], words[0][1]['word']) and \
+                    abs(stream[-1][2] - words[0][2]) <= tolerance:
+                words = words[1:]
+        stream.extend(words)
+
+    stitched = {section: list() for section in sections}
+    for seq_num, (section, word, start_time, end_time) in enumerate(stream, start=1):
+        stitched[section].append({
+            'seq_num': seq_num,
+            'word': word['word'],
+            'start_time': word['start_time'],
+            'end_time': word['end_time']
+        })
+    return stitched
+
+
+def stitch_transcript(protagonist_sections, non_protagonist_sections, speaker_type, section_length):
+    """
+    Stitches the sections of a transcript (see stitch_words) on each protagonist side that `speaker_type` produces.
+    The other side is left out, although it is empty: it holds the words of the other speaker types of the part.
+
+    Returns {protagonist: {section: words}}.
+    """
+    if speaker_type not in PROTAGONIST_SIDES:
+        raise TypeError(f"Invalid speaker type: {speaker_type}")
+    sections = {1: protagonist_sections, 0: non_protagonist_sections}
+    return {protagonist: stitch_words(sections=sections[protagonist], section_length=section_length)
+            for protagonist in PROTAGONIST_SIDES[speaker_type]}
@@ -0,0 +1,268 @@
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from pathlib import Path
+import csv
+import io
+import json
+import random
+import threading
+import time
+
+# Sheets rejects very large requests, so a batch is flushed well before it gets close to the limit
+MAX_PAYLOAD_BYTES = 2 * 1024 * 1024
+MAX_REQUESTS = 500
+# CSVs are pasted in pieces of this size, so memory use does not depend on the length of a part
+MAX_PASTE_BYTES = 512 * 1024
+MAX_TRIES = 8
+RETRY_STATUS = (429, 500, 503)
+# default per-user quotas of the Sheets and Drive APIs
+SHEETS_REQUESTS_PER_MINUTE = 60
+DRIVE_REQUESTS_PER_MINUTE = 600
+DRIVE_CACHE_TTL = 3600  # seconds
+
+
+class RateLimiter:
+    """
+    Spaces out calls shared by several threads so that no more than `calls_per_minute` are made.
+    """
+    def __init__(self, calls_per_minute):
+        self.interval = 60.0 / calls_per_minute
+        self.next_call = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class GoogleClientPool:
+    """
+    Drive and Sheets clients for concurrent exports. The discovery clients are not thread-safe, so each worker
+    thread builds its own pair on first use; the credentials and the rate limiters are shared by all of them.
+    """
+    def __init__(self, credentials_drive, credentials_sheets,
+                 drive_per_minute=DRIVE_REQUESTS_PER_MINUTE, sheets_per_minute=SHEETS_REQUESTS_PER_MINUTE):
+        self.credentials_drive = credentials_drive
+        self.credentials_sheets = credentials_sheets
+        self.drive_limiter = RateLimiter(drive_per_minute)
+        self.sheets_limiter = RateLimiter(sheets_per_minute)
+        self.local = threading.local()
+
+    def drive(self):
+        if getattr(self.local, 'drive', None) is None:
+            self.local.drive = build('drive', 'v3', credentials=self.credentials_drive, cache_discovery=False)
+        return self.local.drive
+
+    def sheets(self):
+        if getattr(self.local, 'sheets', None) is None:
+            self.local.sheets = build('sheets', 'v4', credentials=self.credentials_sheets, cache_discovery=False)
+        return self.local.sheets
+
+    def execute_drive(self, request):
+        return execute(request, rate_limiter=self.drive_limiter)
+
+    def execute_sheets(self, request):
+        return execute(request, rate_limiter=self.sheets_limiter)
+
+
+def execute(request, rate_limiter=None, max_tries=MAX_TRIES):
+    """
+    Executes a Google API request, retrying with exponential backoff when the quota is exceeded (HTTP 429) or
+    the service has a transient error.
+    """
+    for attempt in range(max_tries):
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        try:
+            return request.execute()
+        except HttpError as error:
+            if error.resp.status not in RETRY_STATUS or attempt == max_tries - 1:
+                raise
+            # write quotas are per minute, so wait up to a minute before trying again
+            retry_after = error.resp.get('retry-after')
+            if retry_after is not None and retry_after.isdigit():
+                delay = int(retry_after)
+            else:
+                delay = min(2 ** attempt, 64) + random.random()
+            print(f"Google API returned {error.resp.status}. Trying again in {delay:.1f} seconds...")
+            time.sleep(delay)
+
+
+class DriveCache:
+    """
+    Answers `name -> id` lookups of Drive folders and spreadsheets locally. The children of a folder are listed
+    once (one paginated `files().list` call instead of one query per entity) and kept for the rest of the run.
+    If `cache_file` is given, the listings are also saved there and reused by later runs for `ttl` seconds.
+    Files created by the exporter must be registered with `add`, so that the cache stays valid.
+    """
+    def __init__(self, clients, cache_file=None, ttl=DRIVE_CACHE_TTL):
+        self.clients = clients
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.folders = dict()
+        self.lock = threading.Lock()
+        if cache_file is not None and Path(cache_file).exists():
+            try:
+                with open(cache_file, 'r', encoding="utf-8") as json_file:
+                    self.folders = json.load(json_file)
+            except ValueError:
+                print(f"Ignoring invalid Drive cache {cache_file}.")
+
+    def lookup(self, folder_id, name, mime_type):
+        with self.lock:
+            folder = self.folders.get(folder_id)
+            if folder is None or time.time() - folder['listed_at'] > self.ttl:
+                folder = self.list_folder(folder_id)
+                self.folders[folder_id] = folder
+            return [file['id'] for file in folder['files']
+                    if file['name'] == name and file['mimeType'] == mime_type]
+
+    def list_folder(self, folder_id):
+        files = list()
+        page_token = None
+        while True:
+            response = self.clients.execute_drive(self.clients.drive().files().list(
+                q=f"'{folder_id}' in parents and trashed = false",
+                spaces='drive',
+                fields='nextPageToken, files(id, name, mimeType)',
+                pageSize=1000,
+                pageToken=page_token))
+            files.extend(response.get('files', []))
+            page_token = response.get('nextPageToken')
+            if page_token is None:
+                return {'listed_at': time.time(), 'files': files}
+
+    def add(self, folder_id, name, mime_type, file_id):
+        with self.lock:
+            if folder_id in self.folders:
+                self.folders[folder_id]['files'].append({'id': file_id, 'name': name, 'mimeType': mime_type})
+
+    def save(self):
+        if self.cache_file is None:
+            return
+        with self.lock:
+            Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding="utf-8") as json_file:
+                json.dump(self.folders, json_file)
+
+
+class SheetsBatch:
+    """
+    Accumulates requests for one spreadsheet and sends them in as few `spreadsheets().batchUpdate` calls as the
+    payload limits allow. Requests are sent in the order they were added, so a sheet can be created, filled and
+    formatted in the same call. Calls go through `execute`, so they are rate limited and retried with exponential
+    backoff.
+
+    Use it as a context manager, or call `flush` when done:
+
+        with SheetsBatch(google_sheets, spreadsheet_id) as batch:
+            batch.add({"addSheet": {...}})
+            batch.paste_csv(sheet_id, filename)
+    """
+    def __init__(self, google_sheets, spreadsheet_id, max_payload=MAX_PAYLOAD_BYTES, max_requests=MAX_REQUESTS,
+                 rate_limiter=None):
+        self.google_sheets = google_sheets
+        self.spreadsheet_id = spreadsheet_id
+        self.max_payload = max_payload
+        self.max_requests = max_requests
+        self.rate_limiter = rate_limiter
+        self.requests = list()
+        self.payload = 0
+        self.calls = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def add(self, request):
+        size = len(json.dumps(request))
+        if len(self.requests) > 0 and \
+                (self.payload + size > self.max_payload or len(self.requests) >= self.max_requests):
+            self.flush()
+        self.requests.append(request)
+        self.payload = self.payload + size
+
+    def add_together(self, *requests):
+        """
+        Adds requests that must be applied together: they are sent in the same `batchUpdate` call, which the API
+        applies atomically.
+        """
+        size = sum(len(json.dumps(request)) for request in requests)
+        if len(self.requests) > 0 and \
+                (self.payload + size > self.max_payload or len(self.requests) + len(requests) > self.max_requests):
+            self.flush()
+        self.requests.extend(requests)
+        self.payload = self.payload + size
+
+    def paste_csv(self, sheet_id, filename, columns=None, min_rows=2, min_columns=1,
+                  max_chunk_bytes=MAX_PASTE_BYTES):
+        """
+        Streams a CSV file into a sheet as a sequence of size-bounded `pasteData` requests at increasing row
+        indexes. Only the first `columns` columns are pasted if it is given, so the columns to their right are left
+        untouched. The grid is resized to the number of rows and columns first, but never below `min_rows` and
+        `min_columns` (pass the current size of the sheet to keep everything that is in it).
+        """
+        with open(filename, 'r', encoding="utf-8", newline='') as csv_file:
+            row_count = 0
+            column_count = 1
+            for row in csv.reader(csv_file):
+                row_count = row_count + 1
+                column_count = max(column_count, len(row[:columns]))
+            self.add({
+                "updateSheetProperties": {
+                    "fields": "gridProperties.rowCount,gridProperties.columnCount",
+                    "properties": {"sheetId": sheet_id,
+                                   "gridProperties": {
+                                       # must be larger than the frozen rows
+                                       "rowCount": max(row_count, min_rows, 2),
+                                       "columnCount": max(column_count, min_columns)
+                                   }}
+                }
+            })
+            csv_file.seek(0)
+            row_index = 0
+            chunk = io.StringIO()
+            chunk_writer = csv.writer(chunk, quoting=csv.QUOTE_ALL, lineterminator='\n')
+            chunk_rows = 0
+            for row in csv.reader(csv_file):
+                chunk_writer.writerow(row[:columns])
+                chunk_rows = chunk_rows + 1
+                if chunk.tell() >= max_chunk_bytes:
+                    self.add_paste(sheet_id=sheet_id, row_index=row_index, data=chunk.getvalue())
+                    row_index = row_index + chunk_rows
+                    chunk = io.StringIO()
+                    chunk_writer = csv.writer(chunk, quoting=csv.QUOTE_ALL, lineterminator='\n')
+                    chunk_rows = 0
+            if chunk_rows > 0:
+                self.add_paste(sheet_id=sheet_id, row_index=row_index, data=chunk.getvalue())
+
+    def add_paste(self, sheet_id, row_index, data):
+        self.add({
+            'pasteData': {
+                "coordinate": {
+                    "sheetId": sheet_id,
+                    "rowIndex": row_index,
+                    "columnIndex": 0,
+                },
+                "data": data,
+                "type": 'PASTE_NORMAL',
+                "delimiter": ',',
+            }
+        })
+
+    def flush(self):
+        if len(self.requests) == 0:
+            return
+        execute(self.google_sheets.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id,
+                                                              body={'requests': self.requests}),
+                rate_limiter=self.rate_limiter)
+        self.calls = self.calls + 1
+        self.requests = list()
+        self.payload = 0